@@ -6,7 +6,7 @@ from PyQt6.QtWidgets import QApplication
 
 from src.core.main_window import MainWindow
 from src.utils.error_handler import handle_exception
-from src.utils.logger import get_logger
+from src.utils.logger import default_log_path, get_logger, setup_logger
 
 
 # Set up global exception handler
@@ -17,6 +17,9 @@ logger = get_logger(__name__)
 
 def main():
     """Main application function."""
+    # Configure file logging before any UI work so disk I/O stays off the UI thread
+    setup_logger("conversion_gui", default_log_path(), background=True)
+    
     logger.info("Starting Conversion GUI application")
     
     app = QApplication(sys.argv)
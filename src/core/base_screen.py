@@ -1,18 +1,27 @@
 """Base screen class for all application screens."""
 
-from abc import ABC, abstractmethod
+from abc import ABCMeta, abstractmethod
 from typing import Optional
 
-from PyQt6.QtWidgets import QWidget
+from PyQt6.QtCore import QTimer
+from PyQt6.QtGui import QShowEvent
+from PyQt6.QtWidgets import QPushButton, QWidget
 
 
-class BaseScreen(QWidget, ABC):
+class _ScreenMeta(type(QWidget), ABCMeta):
+    """Metaclass combining the Qt wrapper type with ABCMeta."""
+
+
+class BaseScreen(QWidget, metaclass=_ScreenMeta):
     """
     Base class for all application screens.
     
     Provides common interface and functionality for all screens.
     """
     
+    # Delay used to coalesce bursts of refresh requests
+    REFRESH_DELAY_MS = 150
+    
     def __init__(self, parent: Optional[QWidget] = None):
         """
         Initialize the base screen.
@@ -22,6 +31,12 @@ class BaseScreen(QWidget, ABC):
         """
         super().__init__(parent)
         self._initialized = False
+        self._refresh_button: Optional[QPushButton] = None
+        
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(self.REFRESH_DELAY_MS)
+        self._refresh_timer.timeout.connect(self._do_refresh)
     
     @property
     @abstractmethod
@@ -45,25 +60,88 @@ class BaseScreen(QWidget, ABC):
         """Load screen data."""
         pass
     
+    def showEvent(self, event: QShowEvent) -> None:
+        """
+        Handle show event.
+        
+        Args:
+            event: Show event
+        """
+        super().showEvent(event)
+        self.initialize()
+    
     def initialize(self) -> None:
         """
         Initialize the screen.
         
-        Called when the screen is first shown.
+        Called when the screen is first shown. The UI is built immediately;
+        data loading is queued so the screen paints before it runs.
         """
         if not self._initialized:
             self.setup_ui()
-            self.load_data()
             self._initialized = True
+            QTimer.singleShot(0, self._load_initial_data)
+    
+    def _load_initial_data(self) -> None:
+        """Run the first data pass after the screen has painted."""
+        self.load_data()
+        self._resize_on_demand()
+    
+    def _resize_on_demand(self) -> None:
+        """
+        Perform expensive resize work once data is available.
+        
+        Called after the first load_data(); subclasses override as needed.
+        """
+        pass
     
     def refresh(self) -> None:
         """
         Refresh screen data.
         
-        Called when the screen needs to reload its data.
+        Called when the screen needs to reload its data. Requests arriving
+        within REFRESH_DELAY_MS of each other are coalesced into one reload.
         """
-        if self._initialized:
+        if self._initialized and not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+            if self._refresh_button is not None:
+                self._refresh_button.setEnabled(False)
+    
+    def _do_refresh(self) -> None:
+        """Reload screen data after a refresh request."""
+        try:
             self.load_data()
+        finally:
+            if self._refresh_button is not None:
+                self._refresh_button.setEnabled(True)
+    
+    def _create_refresh_button(self) -> QPushButton:
+        """
+        Create the screen's refresh button.
+        
+        The button is disabled from the moment a refresh is requested until
+        the reload has finished, so repeated clicks cannot queue up reloads.
+        
+        Returns:
+            Refresh button connected to refresh()
+        """
+        button = QPushButton("Refresh")
+        button.clicked.connect(self.refresh)
+        self._refresh_button = button
+        return button
+    
+    def on_tick(self, tick: int) -> None:
+        """
+        Handle the application's periodic tick.
+        
+        Only the currently visible screen receives ticks, and only if it
+        overrides this method. Screens that need periodic updates should
+        override this instead of running their own timers.
+        
+        Args:
+            tick: Tick counter
+        """
+        pass
     
     def cleanup(self) -> None:
         """
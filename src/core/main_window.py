@@ -1,6 +1,7 @@
 """Main application window."""
 
-from typing import Dict, Optional
+from functools import partial
+from typing import Callable, Dict, List, Optional
 
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -8,9 +9,10 @@ from PyQt6.QtWidgets import (
     QMenuBar, QMenu, QToolBar, QStatusBar, QMessageBox,
     QDialog, QLabel, QTextEdit, QPushButton
 )
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt, QSize, QSignalBlocker, QTimer
 from PyQt6.QtGui import QAction, QIcon
 
+from .base_screen import BaseScreen
 from ..screens.dashboard_screen import DashboardScreen
 from ..screens.db_browser_screen import DBBrowserScreen
 from ..screens.payments_screen import PaymentsScreen
@@ -19,7 +21,7 @@ from ..screens.log_analytics_screen import LogAnalyticsScreen
 from ..screens.xml_helper_screen import XMLHelperScreen
 from ..screens.search_screen import SearchScreen
 from ..utils.settings import Settings
-from ..utils.logger import get_logger, setup_logger
+from ..utils.logger import get_logger
 from ..plugins.plugin_manager import PluginManager
 
 
@@ -49,16 +51,10 @@ class SettingsDialog(QDialog):
         
         layout.addWidget(QLabel("<h2>Application Settings</h2>"))
         
-        # Settings display (simplified for now)
-        settings_text = QTextEdit()
-        settings_text.setReadOnly(True)
-        settings_text.setPlainText(
-            f"Window Size: {settings.get('window.width')}x{settings.get('window.height')}\n"
-            f"Theme: {settings.get('theme')}\n"
-            f"Log Level: {settings.get('log_level')}\n"
-            f"Plugins Enabled: {settings.get('plugins_enabled')}\n"
-        )
-        layout.addWidget(settings_text)
+        # Settings display (simplified for now), filled in on first show
+        self.settings_text = QTextEdit()
+        self.settings_text.setReadOnly(True)
+        layout.addWidget(self.settings_text)
         
         # Close button
         close_button = QPushButton("Close")
@@ -66,6 +62,24 @@ class SettingsDialog(QDialog):
         layout.addWidget(close_button)
         
         self.setLayout(layout)
+    
+    def showEvent(self, event) -> None:
+        """
+        Handle show event.
+        
+        Args:
+            event: Show event
+        """
+        super().showEvent(event)
+        if not self.settings_text.toPlainText():
+            snap = self.settings.snapshot()
+            window = snap.get("window", {})
+            self.settings_text.setPlainText(
+                f"Window Size: {window.get('width')}x{window.get('height')}\n"
+                f"Theme: {snap.get('theme')}\n"
+                f"Log Level: {snap.get('log_level')}\n"
+                f"Plugins Enabled: {snap.get('plugins_enabled')}\n"
+            )
 
 
 class MainWindow(QMainWindow):
@@ -73,6 +87,9 @@ class MainWindow(QMainWindow):
     Main application window with navigation and content areas.
     """
     
+    # Interval of the shared periodic tick delivered to the current screen
+    TICK_INTERVAL_MS = 1000
+    
     def __init__(self):
         """Initialize the main window."""
         super().__init__()
@@ -81,12 +98,20 @@ class MainWindow(QMainWindow):
         self.settings = Settings()
         self.plugin_manager = PluginManager()
         
-        # Set up logger
-        log_file = str(self.settings.settings_file.parent / "app.log")
-        setup_logger("conversion_gui", log_file)
-        
-        # Screens dictionary
-        self.screens: Dict[str, QWidget] = {}
+        # Screens dictionary (None until the screen is first shown)
+        self.screens: Dict[str, Optional[BaseScreen]] = {}
+        self._factories: Dict[str, Callable[[], BaseScreen]] = {}
+        self._screen_by_index: List[Optional[BaseScreen]] = []
+        self._nav_names: List[str] = []
+        self._nav_index: Dict[str, int] = {}
+        self._current_index = -1
+        
+        # Shared periodic tick, delivered only to the visible screen and
+        # running only while that screen handles it
+        self._tick_count = 0
+        self._tick_timer = QTimer(self)
+        self._tick_timer.setInterval(self.TICK_INTERVAL_MS)
+        self._tick_timer.timeout.connect(self._on_tick)
         
         # Set up UI
         self._setup_ui()
@@ -131,13 +156,13 @@ class MainWindow(QMainWindow):
         self.status_bar.showMessage("Ready")
         
         # Add screens
-        self._add_screen("Dashboard", DashboardScreen())
-        self._add_screen("Database Browser", DBBrowserScreen())
-        self._add_screen("Payments", PaymentsScreen())
-        self._add_screen("Conversion Jobs", ConversionJobsScreen())
-        self._add_screen("Log Analytics", LogAnalyticsScreen())
-        self._add_screen("XML Helper", XMLHelperScreen())
-        self._add_screen("Search", SearchScreen())
+        self._add_screen("Dashboard", DashboardScreen)
+        self._add_screen("Database Browser", DBBrowserScreen)
+        self._add_screen("Payments", PaymentsScreen)
+        self._add_screen("Conversion Jobs", ConversionJobsScreen)
+        self._add_screen("Log Analytics", LogAnalyticsScreen)
+        self._add_screen("XML Helper", XMLHelperScreen)
+        self._add_screen("Search", SearchScreen)
         
         # Select first screen
         if self.nav_list.count() > 0:
@@ -147,60 +172,32 @@ class MainWindow(QMainWindow):
         """Create the menu bar."""
         menubar = self.menuBar()
         
-        # File menu
-        file_menu = menubar.addMenu("&File")
-        
-        new_action = QAction("&New...", self)
-        new_action.setShortcut("Ctrl+N")
-        new_action.triggered.connect(self._on_new_clicked)
-        file_menu.addAction(new_action)
-        
-        open_action = QAction("&Open...", self)
-        open_action.setShortcut("Ctrl+O")
-        open_action.triggered.connect(self._on_open_clicked)
-        file_menu.addAction(open_action)
-        
-        file_menu.addSeparator()
-        
-        settings_action = QAction("&Settings...", self)
-        settings_action.triggered.connect(self._on_settings_clicked)
-        file_menu.addAction(settings_action)
-        
-        file_menu.addSeparator()
-        
-        exit_action = QAction("E&xit", self)
-        exit_action.setShortcut("Ctrl+Q")
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-        
-        # Edit menu
-        edit_menu = menubar.addMenu("&Edit")
-        
-        refresh_action = QAction("&Refresh", self)
-        refresh_action.setShortcut("F5")
-        refresh_action.triggered.connect(self._on_refresh_clicked)
-        edit_menu.addAction(refresh_action)
-        
-        # View menu
-        view_menu = menubar.addMenu("&View")
-        
-        dashboard_action = QAction("&Dashboard", self)
-        dashboard_action.triggered.connect(lambda: self._navigate_to("Dashboard"))
-        view_menu.addAction(dashboard_action)
-        
-        # Tools menu
-        tools_menu = menubar.addMenu("&Tools")
-        
-        plugins_action = QAction("&Plugins...", self)
-        plugins_action.triggered.connect(self._on_plugins_clicked)
-        tools_menu.addAction(plugins_action)
-        
-        # Help menu
-        help_menu = menubar.addMenu("&Help")
+        # Each action is (text, shortcut, status tip, slot); None is a separator
+        menus = (
+            ("&File", (
+                ("&New...", "Ctrl+N", None, self._on_new_clicked),
+                ("&Open...", "Ctrl+O", None, self._on_open_clicked),
+                None,
+                ("&Settings...", None, None, self._on_settings_clicked),
+                None,
+                ("E&xit", "Ctrl+Q", None, self.close),
+            )),
+            ("&Edit", (
+                ("&Refresh", "F5", None, self._on_refresh_clicked),
+            )),
+            ("&View", (
+                ("&Dashboard", None, None, partial(self._navigate_to, "Dashboard")),
+            )),
+            ("&Tools", (
+                ("&Plugins...", None, None, self._on_plugins_clicked),
+            )),
+            ("&Help", (
+                ("&About...", None, None, self._on_about_clicked),
+            )),
+        )
         
-        about_action = QAction("&About...", self)
-        about_action.triggered.connect(self._on_about_clicked)
-        help_menu.addAction(about_action)
+        for title, actions in menus:
+            self._add_actions(menubar.addMenu(title), actions)
     
     def _create_toolbar(self) -> None:
         """Create the toolbar."""
@@ -208,69 +205,113 @@ class MainWindow(QMainWindow):
         toolbar.setIconSize(QSize(24, 24))
         self.addToolBar(toolbar)
         
-        # Home action
-        home_action = QAction("Home", self)
-        home_action.setStatusTip("Go to Dashboard")
-        home_action.triggered.connect(lambda: self._navigate_to("Dashboard"))
-        toolbar.addAction(home_action)
-        
-        toolbar.addSeparator()
-        
-        # Refresh action
-        refresh_action = QAction("Refresh", self)
-        refresh_action.setStatusTip("Refresh current screen")
-        refresh_action.triggered.connect(self._on_refresh_clicked)
-        toolbar.addAction(refresh_action)
-        
-        toolbar.addSeparator()
+        self._add_actions(toolbar, (
+            ("Home", None, "Go to Dashboard", partial(self._navigate_to, "Dashboard")),
+            None,
+            ("Refresh", None, "Refresh current screen", self._on_refresh_clicked),
+            None,
+            ("Search", None, "Open search", partial(self._navigate_to, "Search")),
+        ))
+    
+    def _add_actions(self, target, actions: tuple) -> None:
+        """
+        Add actions to a menu or toolbar.
         
-        # Search action
-        search_action = QAction("Search", self)
-        search_action.setStatusTip("Open search")
-        search_action.triggered.connect(lambda: self._navigate_to("Search"))
-        toolbar.addAction(search_action)
+        Args:
+            target: Menu or toolbar to add actions to
+            actions: Tuple of (text, shortcut, status tip, slot) entries,
+                with None marking a separator
+        """
+        for item in actions:
+            if item is None:
+                target.addSeparator()
+                continue
+            
+            text, shortcut, status_tip, slot = item
+            action = QAction(text, self)
+            if shortcut:
+                action.setShortcut(shortcut)
+            if status_tip:
+                action.setStatusTip(status_tip)
+            action.triggered.connect(slot)
+            target.addAction(action)
     
-    def _add_screen(self, name: str, screen: QWidget) -> None:
+    def _add_screen(self, name: str, factory: Callable[[], BaseScreen]) -> None:
         """
-        Add a screen to the application.
+        Register a screen with the application.
+        
+        The screen itself is not constructed until it is first selected;
+        a lightweight placeholder occupies its slot in the content stack.
         
         Args:
             name: Screen name
-            screen: Screen widget
+            factory: Callable returning the screen
         """
         # Add to navigation
         self.nav_list.addItem(name)
         
-        # Add to content stack
-        self.content_stack.addWidget(screen)
+        # Reserve a slot in the content stack
+        self.content_stack.addWidget(QWidget())
         
-        # Store reference
-        self.screens[name] = screen
+        # Store factory
+        self._factories[name] = factory
+        self.screens[name] = None
+        self._nav_index[name] = len(self._nav_names)
+        self._nav_names.append(name)
+        self._screen_by_index.append(None)
         
-        logger.debug(f"Added screen: {name}")
+        logger.debug("Added screen: %s", name)
     
-    def _on_nav_changed(self, index: int) -> None:
+    def _get_screen(self, index: int, name: str) -> BaseScreen:
         """
-        Handle navigation change.
+        Get a screen, constructing it on first access.
         
         Args:
-            index: Selected navigation index
+            index: Position of the screen in the content stack
+            name: Screen name
+            
+        Returns:
+            Screen instance
+        """
+        screen = self.screens.get(name)
+        if screen is None:
+            screen = self._factories[name]()
+            placeholder = self.content_stack.widget(index)
+            self.content_stack.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self.content_stack.insertWidget(index, screen)
+            self.screens[name] = screen
+            self._screen_by_index[index] = screen
+            logger.debug("Created screen: %s", name)
+        return screen
+    
+    def _show_screen(self, index: int) -> None:
         """
-        self.content_stack.setCurrentIndex(index)
+        Switch the content area to a screen.
         
-        # Get screen name
-        item = self.nav_list.item(index)
-        if item:
-            screen_name = item.text()
+        Args:
+            index: Navigation index of the screen
+        """
+        self._current_index = index
+        
+        if 0 <= index < len(self._nav_names):
+            screen_name = self._nav_names[index]
+            screen = self._get_screen(index, screen_name)
+            self.content_stack.setCurrentWidget(screen)
+            self._update_tick_timer(screen)
             self.setWindowTitle(f"Conversion GUI - {screen_name}")
             self.status_bar.showMessage(f"Viewing: {screen_name}")
             
-            # Initialize screen if needed
-            screen = self.screens.get(screen_name)
-            if screen and hasattr(screen, 'initialize'):
-                screen.initialize()
-            
-            logger.debug(f"Navigated to: {screen_name}")
+            logger.debug("Navigated to: %s", screen_name)
+    
+    def _on_nav_changed(self, index: int) -> None:
+        """
+        Handle navigation change.
+        
+        Args:
+            index: Selected navigation index
+        """
+        self._show_screen(index)
     
     def _navigate_to(self, screen_name: str) -> None:
         """
@@ -279,11 +320,34 @@ class MainWindow(QMainWindow):
         Args:
             screen_name: Name of screen to navigate to
         """
-        for i in range(self.nav_list.count()):
-            item = self.nav_list.item(i)
-            if item and item.text() == screen_name:
-                self.nav_list.setCurrentRow(i)
-                break
+        index = self._nav_index.get(screen_name)
+        if index is None or index == self._current_index:
+            return
+        
+        with QSignalBlocker(self.nav_list):
+            self.nav_list.setCurrentRow(index)
+        self._show_screen(index)
+    
+    def _update_tick_timer(self, screen: BaseScreen) -> None:
+        """
+        Run the periodic tick only while the current screen overrides on_tick.
+        
+        Args:
+            screen: Screen being shown
+        """
+        if type(screen).on_tick is not BaseScreen.on_tick:
+            self._tick_timer.start()
+        else:
+            self._tick_timer.stop()
+    
+    def _on_tick(self) -> None:
+        """Forward the periodic tick to the current screen."""
+        self._tick_count += 1
+        
+        if 0 <= self._current_index < len(self._screen_by_index):
+            screen = self._screen_by_index[self._current_index]
+            if screen is not None:
+                screen.on_tick(self._tick_count)
     
     def _on_new_clicked(self) -> None:
         """Handle new action."""
@@ -297,10 +361,11 @@ class MainWindow(QMainWindow):
     
     def _on_refresh_clicked(self) -> None:
         """Handle refresh action."""
-        current_index = self.content_stack.currentIndex()
-        screen = self.content_stack.widget(current_index)
+        if not 0 <= self._current_index < len(self._screen_by_index):
+            return
         
-        if screen and hasattr(screen, 'refresh'):
+        screen = self._screen_by_index[self._current_index]
+        if screen is not None:
             screen.refresh()
             self.status_bar.showMessage("Refreshed", 2000)
             logger.info("Screen refreshed")
@@ -368,14 +433,19 @@ class MainWindow(QMainWindow):
             event: Close event
         """
         # Save window state
-        self.settings.set("window.width", self.width())
-        self.settings.set("window.height", self.height())
-        self.settings.set("window.maximized", self.isMaximized())
-        self.settings.save()
+        window_state = {
+            "window.width": self.width(),
+            "window.height": self.height(),
+            "window.maximized": self.isMaximized(),
+        }
+        if self.settings.update(window_state):
+            self.settings.save()
+        
+        self._tick_timer.stop()
         
         # Cleanup screens
         for screen in self.screens.values():
-            if hasattr(screen, 'cleanup'):
+            if screen is not None:
                 screen.cleanup()
         
         logger.info("Application closing")
@@ -15,7 +15,7 @@ class JobStatus(Enum):
     CANCELLED = "Cancelled"
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class JobError:
     """
     Represents a job error.
@@ -26,10 +26,14 @@ class JobError:
     stack_trace: str = ""
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class BatchInfo:
     """
     Represents batch processing information.
+    
+    The progress percentage is precomputed; use update_progress() to
+    change item counts so it stays in sync. Batch IDs are only unique
+    within a job, so batches compare and hash by identity.
     """
     batch_id: str
     total_items: int
@@ -37,19 +41,43 @@ class BatchInfo:
     failed_items: int
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
+    _cached_progress: float = field(default=0.0, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        """Compute cached values."""
+        self._recompute_progress()
+    
+    def _recompute_progress(self) -> None:
+        """Recompute the cached progress percentage."""
+        if self.total_items == 0:
+            self._cached_progress = 0.0
+        else:
+            self._cached_progress = (self.processed_items / self.total_items) * 100
     
     @property
     def progress_percentage(self) -> float:
-        """Calculate progress percentage."""
-        if self.total_items == 0:
-            return 0.0
-        return (self.processed_items / self.total_items) * 100
+        """Get progress percentage."""
+        return self._cached_progress
+    
+    def update_progress(self, processed_items: int, failed_items: int) -> None:
+        """
+        Update item counts.
+        
+        Args:
+            processed_items: Number of processed items
+            failed_items: Number of failed items
+        """
+        self.processed_items = processed_items
+        self.failed_items = failed_items
+        self._recompute_progress()
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class ConversionJob:
     """
     Represents a conversion job.
+    
+    Jobs compare and hash by job_id.
     """
     job_id: str
     name: str
@@ -63,6 +91,21 @@ class ConversionJob:
     batches: List[BatchInfo] = field(default_factory=list)
     source_file: str = ""
     target_file: str = ""
+    _completed_batches: int = field(default=0, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        """Initialize derived counters."""
+        self.recompute_counters()
+    
+    def __eq__(self, other: object) -> bool:
+        """Compare by job ID."""
+        if not isinstance(other, ConversionJob):
+            return NotImplemented
+        return self.job_id == other.job_id
+    
+    def __hash__(self) -> int:
+        """Hash by job ID."""
+        return hash(self.job_id)
     
     @property
     def duration(self) -> Optional[float]:
@@ -84,4 +127,36 @@ class ConversionJob:
     @property
     def completed_batches(self) -> int:
         """Get number of completed batches."""
-        return sum(1 for batch in self.batches if batch.end_time is not None)
+        return self._completed_batches
+    
+    def add_batch(self, batch: BatchInfo) -> None:
+        """
+        Add a batch to the job.
+        
+        Args:
+            batch: Batch to add
+        """
+        self.batches.append(batch)
+        if batch.end_time is not None:
+            self._completed_batches += 1
+    
+    def on_batch_finished(self, batch: BatchInfo, end_time: Optional[datetime] = None) -> None:
+        """
+        Mark a batch of this job as finished.
+        
+        Args:
+            batch: Batch that finished
+            end_time: Completion time (defaults to now)
+        """
+        if batch.end_time is None:
+            batch.end_time = end_time or datetime.now()
+            self._completed_batches += 1
+    
+    def recompute_counters(self) -> None:
+        """
+        Recompute derived counters from the batch list.
+        
+        Call after modifying batches directly instead of through
+        add_batch() / on_batch_finished().
+        """
+        self._completed_batches = sum(1 for batch in self.batches if batch.end_time is not None)
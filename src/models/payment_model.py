@@ -1,6 +1,6 @@
 """Data models for payments."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
@@ -25,13 +25,18 @@ class PaymentMethod(Enum):
     OTHER = "Other"
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Payment:
     """
     Represents a payment transaction.
+    
+    Amounts are stored as an integer number of cents (smallest currency
+    unit). The formatted amount is precomputed; use set_amount() to change
+    the amount or currency so it stays in sync. Payments compare and hash
+    by payment_id.
     """
     payment_id: str
-    amount: Decimal
+    amount_cents: int
     currency: str
     status: PaymentStatus
     method: PaymentMethod
@@ -41,6 +46,33 @@ class Payment:
     customer_name: str = ""
     transaction_id: str = ""
     description: str = ""
+    _cached_formatted: str = field(default="", init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        """Compute cached values."""
+        self._cached_formatted = self._format_amount()
+    
+    def __eq__(self, other: object) -> bool:
+        """Compare by payment ID."""
+        if not isinstance(other, Payment):
+            return NotImplemented
+        return self.payment_id == other.payment_id
+    
+    def __hash__(self) -> int:
+        """Hash by payment ID."""
+        return hash(self.payment_id)
+    
+    def _format_amount(self) -> str:
+        """Format the amount using integer arithmetic."""
+        cents = self.amount_cents
+        sign = "-" if cents < 0 else ""
+        units, cents = divmod(abs(cents), 100)
+        return f"{self.currency} {sign}{units}.{cents:02d}"
+    
+    @property
+    def amount(self) -> Decimal:
+        """Get amount as a Decimal."""
+        return Decimal(self.amount_cents).scaleb(-2)
     
     @property
     def is_completed(self) -> bool:
@@ -55,4 +87,17 @@ class Payment:
     @property
     def formatted_amount(self) -> str:
         """Get formatted amount string."""
-        return f"{self.currency} {self.amount:.2f}"
+        return self._cached_formatted
+    
+    def set_amount(self, amount_cents: int, currency: Optional[str] = None) -> None:
+        """
+        Update the payment amount.
+        
+        Args:
+            amount_cents: New amount in cents
+            currency: New currency (unchanged if None)
+        """
+        self.amount_cents = amount_cents
+        if currency is not None:
+            self.currency = currency
+        self._cached_formatted = self._format_amount()
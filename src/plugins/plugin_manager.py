@@ -1,9 +1,11 @@
 """Plugin manager for loading and managing plugins."""
 
 import importlib.util
+import os
+import py_compile
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from .plugin_interface import PluginInterface
 from ..utils.logger import get_logger
@@ -17,6 +19,9 @@ class PluginManager:
     Plugin manager for discovering, loading, and managing plugins.
     """
     
+    # Prefix for plugin modules registered in sys.modules
+    MODULE_PREFIX = "conversion_gui_plugin"
+    
     def __init__(self, plugin_dir: Optional[str] = None):
         """
         Initialize the plugin manager.
@@ -32,27 +37,38 @@ class PluginManager:
         self.plugin_dir.mkdir(parents=True, exist_ok=True)
         
         self._plugins: Dict[str, PluginInterface] = {}
-        self._enabled_plugins: set = set()
+        self._enabled_plugins: Dict[str, PluginInterface] = {}
+        self._discover_cache: Optional[Tuple[int, List[str]]] = None
     
     def discover_plugins(self) -> List[str]:
         """
         Discover available plugins in the plugin directory.
         
+        Results are cached until the directory modification time changes.
+        
         Returns:
             List of discovered plugin names
         """
-        discovered = []
+        try:
+            mtime = self.plugin_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
         
-        if not self.plugin_dir.exists():
-            return discovered
+        if self._discover_cache is not None and self._discover_cache[0] == mtime:
+            return list(self._discover_cache[1])
         
-        for path in self.plugin_dir.glob("*.py"):
-            if path.stem.startswith("_"):
-                continue
-            discovered.append(path.stem)
+        discovered = []
         
-        logger.info(f"Discovered {len(discovered)} plugins")
-        return discovered
+        with os.scandir(self.plugin_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith("_") or not name.endswith(".py"):
+                    continue
+                discovered.append(name[:-3])
+        
+        self._discover_cache = (mtime, discovered)
+        logger.info("Discovered %s plugins", len(discovered))
+        return list(discovered)
     
     def load_plugin(self, plugin_name: str) -> bool:
         """
@@ -67,42 +83,122 @@ class PluginManager:
         plugin_path = self.plugin_dir / f"{plugin_name}.py"
         
         if not plugin_path.exists():
-            logger.error(f"Plugin file not found: {plugin_path}")
+            logger.error("Plugin file not found: %s", plugin_path)
             return False
         
+        module_name = self._module_name(plugin_name)
+        
         try:
-            spec = importlib.util.spec_from_file_location(plugin_name, plugin_path)
+            spec = importlib.util.spec_from_file_location(module_name, plugin_path)
             if spec is None or spec.loader is None:
-                logger.error(f"Could not load spec for plugin: {plugin_name}")
+                logger.error("Could not load spec for plugin: %s", plugin_name)
                 return False
             
             module = importlib.util.module_from_spec(spec)
-            sys.modules[plugin_name] = module
+            sys.modules[module_name] = module
             spec.loader.exec_module(module)
             
             # Find plugin class
-            plugin_class = None
-            for item_name in dir(module):
-                item = getattr(module, item_name)
-                if (isinstance(item, type) and 
-                    issubclass(item, PluginInterface) and 
-                    item is not PluginInterface):
-                    plugin_class = item
-                    break
+            plugin_class = getattr(module, "PLUGIN_CLASS", None)
+            if plugin_class is None:
+                plugin_class = self._find_plugin_class(module)
             
             if plugin_class is None:
-                logger.error(f"No plugin class found in {plugin_name}")
+                logger.error("No plugin class found in %s", plugin_name)
+                sys.modules.pop(module_name, None)
                 return False
             
+            self._precompile(plugin_path)
             plugin_instance = plugin_class()
             self._plugins[plugin_name] = plugin_instance
-            logger.info(f"Loaded plugin: {plugin_instance.name} v{plugin_instance.version}")
+            logger.info("Loaded plugin: %s v%s", plugin_instance.name, plugin_instance.version)
             return True
             
         except Exception as e:
-            logger.error(f"Error loading plugin {plugin_name}: {e}", exc_info=True)
+            logger.error("Error loading plugin %s: %s", plugin_name, e, exc_info=True)
+            sys.modules.pop(module_name, None)
             return False
     
+    def reload_plugin(self, plugin_name: str) -> bool:
+        """
+        Reload a plugin from disk.
+        
+        Args:
+            plugin_name: Name of the plugin to reload
+            
+        Returns:
+            True if plugin reloaded successfully, False otherwise
+        """
+        if plugin_name in self._plugins and not self.unload_plugin(plugin_name):
+            return False
+        return self.load_plugin(plugin_name)
+    
+    @staticmethod
+    def _precompile(plugin_path: Path) -> None:
+        """
+        Write cached bytecode for a plugin if it is missing or stale.
+        
+        The file is written where the source loader looks for it, so later
+        loads skip compilation. Nothing is written when bytecode writing is
+        disabled (sys.dont_write_bytecode), and a cache that cannot be
+        written, e.g. in a read-only plugin directory, is only logged.
+        
+        Args:
+            plugin_path: Path to the plugin source file
+        """
+        if sys.dont_write_bytecode:
+            return
+        
+        cfile = importlib.util.cache_from_source(str(plugin_path))
+        try:
+            if os.stat(cfile).st_mtime >= plugin_path.stat().st_mtime:
+                return
+        except OSError:
+            pass
+        
+        try:
+            py_compile.compile(str(plugin_path), cfile=cfile, doraise=False)
+        except OSError as e:
+            logger.warning("Could not write bytecode for %s: %s", plugin_path, e)
+    
+    @classmethod
+    def _module_name(cls, plugin_name: str) -> str:
+        """
+        Get the sys.modules key for a plugin.
+        
+        Args:
+            plugin_name: Name of the plugin
+            
+        Returns:
+            Namespaced module name
+        """
+        return f"{cls.MODULE_PREFIX}.{plugin_name}"
+    
+    @staticmethod
+    def _find_plugin_class(module) -> Optional[type]:
+        """
+        Find a plugin class defined in a module.
+        
+        Used for plugins that do not declare PLUGIN_CLASS. Only classes
+        defined in the module itself are considered, so imported names
+        are skipped.
+        
+        Args:
+            module: Loaded plugin module
+            
+        Returns:
+            Plugin class or None
+        """
+        module_name = module.__name__
+        for item_name, item in vars(module).items():
+            if item_name.startswith("_") or not isinstance(item, type):
+                continue
+            if item.__module__ != module_name:
+                continue
+            if issubclass(item, PluginInterface) and item is not PluginInterface:
+                return item
+        return None
+    
     def unload_plugin(self, plugin_name: str) -> bool:
         """
         Unload a plugin by name.
@@ -120,11 +216,12 @@ class PluginManager:
             plugin = self._plugins[plugin_name]
             plugin.cleanup()
             del self._plugins[plugin_name]
-            self._enabled_plugins.discard(plugin_name)
-            logger.info(f"Unloaded plugin: {plugin_name}")
+            self._enabled_plugins.pop(plugin_name, None)
+            sys.modules.pop(self._module_name(plugin_name), None)
+            logger.info("Unloaded plugin: %s", plugin_name)
             return True
         except Exception as e:
-            logger.error(f"Error unloading plugin {plugin_name}: {e}")
+            logger.error("Error unloading plugin %s: %s", plugin_name, e)
             return False
     
     def enable_plugin(self, plugin_name: str, app_context) -> bool:
@@ -145,11 +242,11 @@ class PluginManager:
         try:
             plugin = self._plugins[plugin_name]
             plugin.initialize(app_context)
-            self._enabled_plugins.add(plugin_name)
-            logger.info(f"Enabled plugin: {plugin_name}")
+            self._enabled_plugins[plugin_name] = plugin
+            logger.info("Enabled plugin: %s", plugin_name)
             return True
         except Exception as e:
-            logger.error(f"Error enabling plugin {plugin_name}: {e}")
+            logger.error("Error enabling plugin %s: %s", plugin_name, e)
             return False
     
     def disable_plugin(self, plugin_name: str) -> bool:
@@ -165,8 +262,8 @@ class PluginManager:
         if plugin_name not in self._enabled_plugins:
             return False
         
-        self._enabled_plugins.discard(plugin_name)
-        logger.info(f"Disabled plugin: {plugin_name}")
+        del self._enabled_plugins[plugin_name]
+        logger.info("Disabled plugin: %s", plugin_name)
         return True
     
     def get_plugin(self, plugin_name: str) -> Optional[PluginInterface]:
@@ -188,7 +285,7 @@ class PluginManager:
         Returns:
             List of enabled plugin instances
         """
-        return [self._plugins[name] for name in self._enabled_plugins if name in self._plugins]
+        return list(self._enabled_plugins.values())
     
     def get_all_plugins(self) -> List[PluginInterface]:
         """
@@ -1,22 +1,275 @@
 """Conversion jobs screen with detailed job view."""
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from PyQt6.QtWidgets import (
     QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QSplitter, QGroupBox, QProgressBar, QTextEdit
+    QSplitter, QGroupBox, QProgressBar, QPlainTextEdit, QHeaderView, QWidget
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QModelIndex, QObject, QRunnable, QThreadPool, pyqtSignal
 
 from ..core.base_screen import BaseScreen
-from ..widgets.data_table import DataTable
+from ..widgets.data_table import DataTable, TableModel
 from ..models.job_model import ConversionJob, JobStatus, JobError, BatchInfo
 from ..utils.logger import get_logger
 
 
 logger = get_logger(__name__)
 
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+
+
+# Sample jobs shown until a job backend is wired in. Built once at import;
+# load_data hands the same objects to the model on every refresh.
+_SAMPLE_JOBS: Tuple[ConversionJob, ...] = (
+    ConversionJob(
+        job_id="JOB001",
+        name="Payment File Conversion",
+        status=JobStatus.COMPLETED,
+        created_at=datetime(2024, 1, 1, 10, 0),
+        started_at=datetime(2024, 1, 1, 10, 1),
+        completed_at=datetime(2024, 1, 1, 10, 30),
+        progress=100.0,
+        threads=4,
+        source_file="payments_2024.csv",
+        target_file="payments_2024.xml",
+        batches=[
+            BatchInfo("BATCH1", 1000, 1000, 0, datetime(2024, 1, 1, 10, 1), datetime(2024, 1, 1, 10, 15)),
+            BatchInfo("BATCH2", 1000, 1000, 0, datetime(2024, 1, 1, 10, 15), datetime(2024, 1, 1, 10, 30)),
+        ]
+    ),
+    ConversionJob(
+        job_id="JOB002",
+        name="Customer Data Import",
+        status=JobStatus.RUNNING,
+        created_at=datetime(2024, 1, 2, 11, 0),
+        started_at=datetime(2024, 1, 2, 11, 1),
+        progress=65.0,
+        threads=2,
+        source_file="customers.json",
+        target_file="customers.db",
+        batches=[
+            BatchInfo("BATCH1", 500, 325, 5, datetime(2024, 1, 2, 11, 1), None),
+        ]
+    ),
+    ConversionJob(
+        job_id="JOB003",
+        name="Legacy System Migration",
+        status=JobStatus.FAILED,
+        created_at=datetime(2024, 1, 3, 12, 0),
+        started_at=datetime(2024, 1, 3, 12, 1),
+        completed_at=datetime(2024, 1, 3, 12, 5),
+        progress=25.0,
+        threads=1,
+        source_file="legacy_data.txt",
+        target_file="new_system.db",
+        errors=[
+            JobError(
+                datetime(2024, 1, 3, 12, 5),
+                "Database connection failed",
+                "Unable to connect to target database",
+                "Connection timeout after 30 seconds"
+            )
+        ]
+    ),
+)
+
+
+class JobDetailSignals(QObject):
+    """Signals emitted by JobDetailFormatter."""
+    
+    finished = pyqtSignal(str, str, str)  # job_id, batch_text, error_text
+
+
+class JobDetailFormatter(QRunnable):
+    """
+    Runnable that formats job batch and error details off the GUI thread.
+    """
+    
+    def __init__(self, job: ConversionJob):
+        """
+        Initialize the formatter.
+        
+        Args:
+            job: Job to format details for
+        """
+        super().__init__()
+        self.job = job
+        self.signals = JobDetailSignals()
+    
+    def run(self) -> None:
+        """Format the job details."""
+        job = self.job
+        
+        # Batch info
+        if job.batches:
+            batch_lines = [
+                f"Total Batches: {job.total_batches}",
+                f"Completed Batches: {job.completed_batches}",
+                "",
+            ]
+            batch_lines.extend(
+                f"{batch.batch_id}: {batch.processed_items}/{batch.total_items} "
+                f"({batch.progress_percentage:.1f}%) Failed: {batch.failed_items}"
+                for batch in job.batches
+            )
+            batch_text = "\n".join(batch_lines)
+        else:
+            batch_text = "No batches"
+        
+        # Errors
+        if job.errors:
+            error_lines = []
+            for error in job.errors:
+                error_lines.append(f"[{error.timestamp.isoformat(' ', 'seconds')}] {error.message}")
+                error_lines.append(f"Details: {error.details}")
+                if error.stack_trace:
+                    error_lines.append(f"Stack Trace: {error.stack_trace}")
+                error_lines.append("")
+            error_text = "\n".join(error_lines)
+        else:
+            error_text = "No errors"
+        
+        self.signals.finished.emit(job.job_id, batch_text, error_text)
+
+
+class JobsTableModel(TableModel):
+    """
+    Table model backed by a list of conversion jobs.
+    
+    Display strings are formatted once when jobs are set, so data() is a
+    plain list lookup. update_jobs() applies changes as row-level inserts,
+    removals and dataChanged signals rather than a full model reset.
+    """
+    
+    HEADERS = ["Job ID", "Name", "Status", "Progress", "Threads", "Created", "Duration"]
+    
+    def __init__(self):
+        """Initialize the jobs table model."""
+        super().__init__(headers=list(self.HEADERS))
+        self._jobs: List[ConversionJob] = []
+        self._row_by_id: Dict[str, int] = {}
+    
+    def set_jobs(self, jobs: Iterable[ConversionJob]) -> None:
+        """
+        Replace the jobs shown by the model.
+        
+        Args:
+            jobs: Jobs to display
+        """
+        self._jobs = list(jobs)
+        self._reindex()
+        self.setData(list(map(self._format_row, self._jobs)))
+    
+    def append_jobs(self, jobs: Iterable[ConversionJob]) -> None:
+        """
+        Append jobs to the end of the model.
+        
+        Args:
+            jobs: Jobs to append
+        """
+        jobs = list(jobs)
+        if not jobs:
+            return
+        
+        first = len(self._jobs)
+        self.beginInsertRows(QModelIndex(), first, first + len(jobs) - 1)
+        for job in jobs:
+            self._row_by_id[job.job_id] = len(self._jobs)
+            self._jobs.append(job)
+            self._data.append(self._format_row(job))
+        self.endInsertRows()
+    
+    def update_jobs(self, jobs: Iterable[ConversionJob]) -> None:
+        """
+        Bring the model in line with a new list of jobs.
+        
+        Jobs are matched by job_id. Existing rows keep their position and
+        are only repainted if their text changed; missing jobs are removed
+        and new jobs are appended.
+        
+        Args:
+            jobs: Current jobs
+        """
+        jobs = list(jobs)
+        incoming = {job.job_id for job in jobs}
+        
+        # Remove from the end so earlier row numbers stay valid
+        for row in range(len(self._jobs) - 1, -1, -1):
+            if self._jobs[row].job_id not in incoming:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._jobs[row]
+                del self._data[row]
+                self.endRemoveRows()
+        self._reindex()
+        
+        last_column = self.columnCount() - 1
+        new_jobs = []
+        for job in jobs:
+            row = self._row_by_id.get(job.job_id)
+            if row is None:
+                new_jobs.append(job)
+                continue
+            
+            self._jobs[row] = job
+            formatted = self._format_row(job)
+            if formatted != self._data[row]:
+                self._data[row] = formatted
+                self.dataChanged.emit(self.index(row, 0), self.index(row, last_column))
+        
+        self.append_jobs(new_jobs)
+    
+    def clear(self) -> None:
+        """Clear all jobs from the model."""
+        self._jobs = []
+        self._row_by_id = {}
+        super().clear()
+    
+    def _reindex(self) -> None:
+        """Rebuild the job_id to row mapping."""
+        self._row_by_id = {job.job_id: row for row, job in enumerate(self._jobs)}
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """Get data at index."""
+        if role != _DISPLAY_ROLE or not index.isValid():
+            return None
+        return self._data[index.row()][index.column()]
+    
+    def job(self, row: int) -> Optional[ConversionJob]:
+        """
+        Get the job for a row.
+        
+        Args:
+            row: Row index
+            
+        Returns:
+            Job at the row or None
+        """
+        return self._jobs[row] if 0 <= row < len(self._jobs) else None
+    
+    @staticmethod
+    def _format_row(job: ConversionJob) -> Tuple[str, ...]:
+        """
+        Format a job as table row strings.
+        
+        Args:
+            job: Job to format
+            
+        Returns:
+            Row values
+        """
+        duration = job.duration
+        return (
+            job.job_id,
+            job.name,
+            job.status.value,
+            f"{job.progress:.1f}%",
+            str(job.threads),
+            job.created_at.isoformat(" ", "minutes"),
+            f"{duration:.1f}s" if duration else "-",
+        )
+
 
 class ConversionJobsScreen(BaseScreen):
     """
@@ -25,6 +278,9 @@ class ConversionJobsScreen(BaseScreen):
     Shows list of jobs and detailed information including threads, errors, and batch progress.
     """
     
+    # Maximum number of lines kept in the error panel
+    MAX_ERROR_LINES = 5000
+    
     @property
     def screen_name(self) -> str:
         """Get screen name."""
@@ -37,7 +293,7 @@ class ConversionJobsScreen(BaseScreen):
     
     def setup_ui(self) -> None:
         """Set up the user interface."""
-        layout = QVBoxLayout()
+        layout = QVBoxLayout(self)
         
         # Title and controls
         header_layout = QHBoxLayout()
@@ -49,9 +305,7 @@ class ConversionJobsScreen(BaseScreen):
         new_job_button.clicked.connect(self._on_new_job_clicked)
         header_layout.addWidget(new_job_button)
         
-        refresh_button = QPushButton("Refresh")
-        refresh_button.clicked.connect(self.refresh)
-        header_layout.addWidget(refresh_button)
+        header_layout.addWidget(self._create_refresh_button())
         
         layout.addLayout(header_layout)
         
@@ -59,25 +313,40 @@ class ConversionJobsScreen(BaseScreen):
         splitter = QSplitter(Qt.Orientation.Vertical)
         
         # Job list table
-        self.jobs_table = DataTable()
+        self._jobs_model = JobsTableModel()
+        self.jobs_table = DataTable(model=self._jobs_model)
+        self.jobs_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         self.jobs_table.doubleClicked.connect(self._on_job_double_clicked)
         splitter.addWidget(self.jobs_table)
         
-        # Job detail view
-        detail_widget = self._create_detail_view()
-        splitter.addWidget(detail_widget)
+        # Job detail view, built when a job is first opened
+        self._detail_widget: Optional[QGroupBox] = None
+        splitter.addWidget(QWidget())
+        self._splitter = splitter
         
-        # Set splitter sizes (60% list, 40% detail)
+        # Split 60% list, 40% detail. Sizes set before the splitter is shown
+        # only take effect in its first layout pass; the stretch factors keep
+        # the ratio when the window is resized.
         splitter.setSizes([600, 400])
+        splitter.setStretchFactor(0, 3)
+        splitter.setStretchFactor(1, 2)
         
         layout.addWidget(splitter)
-        self.setLayout(layout)
         
         self._current_job: Optional[ConversionJob] = None
-        self._sample_jobs = []
+        self._sample_jobs: Tuple[ConversionJob, ...] = ()
         
         logger.info("Conversion Jobs screen UI initialized")
     
+    def _ensure_detail_view(self) -> None:
+        """Create the job detail view if it does not exist yet."""
+        if self._detail_widget is None:
+            self._detail_widget = self._create_detail_view()
+            placeholder = self._splitter.replaceWidget(1, self._detail_widget)
+            if placeholder is not None:
+                placeholder.deleteLater()
+            self._splitter.setStretchFactor(1, 2)
+    
     def _create_detail_view(self) -> QGroupBox:
         """
         Create the job detail view widget.
@@ -86,7 +355,7 @@ class ConversionJobsScreen(BaseScreen):
             Detail view widget
         """
         detail_group = QGroupBox("Job Details")
-        detail_layout = QVBoxLayout()
+        detail_layout = QVBoxLayout(detail_group)
         
         # Job info
         info_layout = QHBoxLayout()
@@ -106,104 +375,41 @@ class ConversionJobsScreen(BaseScreen):
         # Progress bar
         self.progress_bar = QProgressBar()
         self.progress_bar.setTextVisible(True)
+        self.progress_bar.setFormat("%p%")
         detail_layout.addWidget(self.progress_bar)
         
         # Batch info
         batch_group = QGroupBox("Batch Progress")
-        batch_layout = QVBoxLayout()
+        batch_layout = QVBoxLayout(batch_group)
         self.batch_info_label = QLabel("No batches")
         batch_layout.addWidget(self.batch_info_label)
-        batch_group.setLayout(batch_layout)
         detail_layout.addWidget(batch_group)
         
         # Errors
         error_group = QGroupBox("Errors")
-        error_layout = QVBoxLayout()
-        self.error_text = QTextEdit()
+        error_layout = QVBoxLayout(error_group)
+        self.error_text = QPlainTextEdit()
         self.error_text.setReadOnly(True)
+        self.error_text.setMaximumBlockCount(self.MAX_ERROR_LINES)
         self.error_text.setMaximumHeight(150)
         error_layout.addWidget(self.error_text)
-        error_group.setLayout(error_layout)
         detail_layout.addWidget(error_group)
         
-        detail_group.setLayout(detail_layout)
         return detail_group
     
     def load_data(self) -> None:
         """Load screen data."""
-        # Sample job data
-        self._sample_jobs = [
-            ConversionJob(
-                job_id="JOB001",
-                name="Payment File Conversion",
-                status=JobStatus.COMPLETED,
-                created_at=datetime(2024, 1, 1, 10, 0),
-                started_at=datetime(2024, 1, 1, 10, 1),
-                completed_at=datetime(2024, 1, 1, 10, 30),
-                progress=100.0,
-                threads=4,
-                source_file="payments_2024.csv",
-                target_file="payments_2024.xml",
-                batches=[
-                    BatchInfo("BATCH1", 1000, 1000, 0, datetime(2024, 1, 1, 10, 1), datetime(2024, 1, 1, 10, 15)),
-                    BatchInfo("BATCH2", 1000, 1000, 0, datetime(2024, 1, 1, 10, 15), datetime(2024, 1, 1, 10, 30)),
-                ]
-            ),
-            ConversionJob(
-                job_id="JOB002",
-                name="Customer Data Import",
-                status=JobStatus.RUNNING,
-                created_at=datetime(2024, 1, 2, 11, 0),
-                started_at=datetime(2024, 1, 2, 11, 1),
-                progress=65.0,
-                threads=2,
-                source_file="customers.json",
-                target_file="customers.db",
-                batches=[
-                    BatchInfo("BATCH1", 500, 325, 5, datetime(2024, 1, 2, 11, 1), None),
-                ]
-            ),
-            ConversionJob(
-                job_id="JOB003",
-                name="Legacy System Migration",
-                status=JobStatus.FAILED,
-                created_at=datetime(2024, 1, 3, 12, 0),
-                started_at=datetime(2024, 1, 3, 12, 1),
-                completed_at=datetime(2024, 1, 3, 12, 5),
-                progress=25.0,
-                threads=1,
-                source_file="legacy_data.txt",
-                target_file="new_system.db",
-                errors=[
-                    JobError(
-                        datetime(2024, 1, 3, 12, 5),
-                        "Database connection failed",
-                        "Unable to connect to target database",
-                        "Connection timeout after 30 seconds"
-                    )
-                ]
-            ),
-        ]
+        self._sample_jobs = _SAMPLE_JOBS
         
         # Update table
-        headers = ["Job ID", "Name", "Status", "Progress", "Threads", "Created", "Duration"]
-        data = [
-            [
-                job.job_id,
-                job.name,
-                job.status.value,
-                f"{job.progress:.1f}%",
-                str(job.threads),
-                job.created_at.strftime("%Y-%m-%d %H:%M"),
-                f"{job.duration:.1f}s" if job.duration else "-"
-            ]
-            for job in self._sample_jobs
-        ]
-        
-        self.jobs_table.setData(data, headers)
+        self._jobs_model.update_jobs(self._sample_jobs)
         
         logger.info("Conversion Jobs data loaded")
     
+    def _resize_on_demand(self) -> None:
+        """Size the job columns to the first data loaded; refreshes keep them."""
+        self.jobs_table.resizeColumnsToContents()
+    
     def _on_job_double_clicked(self, index) -> None:
         """
         Handle job double-click to show details.
@@ -211,9 +417,9 @@ class ConversionJobsScreen(BaseScreen):
         Args:
             index: Clicked index
         """
-        row = index.row()
-        if 0 <= row < len(self._sample_jobs):
-            self._show_job_details(self._sample_jobs[row])
+        job = self._jobs_model.job(index.row())
+        if job is not None:
+            self._show_job_details(job)
     
     def _show_job_details(self, job: ConversionJob) -> None:
         """
@@ -222,6 +428,7 @@ class ConversionJobsScreen(BaseScreen):
         Args:
             job: Job to show details for
         """
+        self._ensure_detail_view()
         self._current_job = job
         
         # Update labels
@@ -229,38 +436,33 @@ class ConversionJobsScreen(BaseScreen):
         self.job_status_label.setText(f"Status: {job.status.value}")
         self.job_threads_label.setText(f"Threads: {job.threads}")
         
-        # Update progress bar
-        self.progress_bar.setValue(int(job.progress))
+        # Update progress bar, skipping the repaint when nothing changed
+        progress = int(job.progress)
+        if self.progress_bar.value() != progress:
+            self.progress_bar.setValue(progress)
         
-        # Update batch info
-        if job.batches:
-            batch_text = f"Total Batches: {job.total_batches}\n"
-            batch_text += f"Completed Batches: {job.completed_batches}\n\n"
-            
-            for batch in job.batches:
-                batch_text += f"{batch.batch_id}: {batch.processed_items}/{batch.total_items} "
-                batch_text += f"({batch.progress_percentage:.1f}%) "
-                batch_text += f"Failed: {batch.failed_items}\n"
-            
-            self.batch_info_label.setText(batch_text)
-        else:
-            self.batch_info_label.setText("No batches")
+        # Format batch and error text in the background
+        formatter = JobDetailFormatter(job)
+        formatter.signals.finished.connect(self._on_job_details_formatted)
+        QThreadPool.globalInstance().start(formatter)
         
-        # Update errors
-        if job.errors:
-            error_text = ""
-            for error in job.errors:
-                error_text += f"[{error.timestamp.strftime('%Y-%m-%d %H:%M:%S')}] {error.message}\n"
-                error_text += f"Details: {error.details}\n"
-                if error.stack_trace:
-                    error_text += f"Stack Trace: {error.stack_trace}\n"
-                error_text += "\n"
-            
-            self.error_text.setPlainText(error_text)
-        else:
-            self.error_text.setPlainText("No errors")
+        logger.info("Showing details for job %s", job.job_id)
+    
+    def _on_job_details_formatted(self, job_id: str, batch_text: str, error_text: str) -> None:
+        """
+        Handle formatted job detail text.
+        
+        Args:
+            job_id: ID of the job the text belongs to
+            batch_text: Formatted batch information
+            error_text: Formatted error information
+        """
+        # Ignore results for a job that is no longer selected
+        if self._current_job is None or self._current_job.job_id != job_id:
+            return
         
-        logger.info(f"Showing details for job {job.job_id}")
+        self.batch_info_label.setText(batch_text)
+        self.error_text.setPlainText(error_text)
     
     def _on_new_job_clicked(self) -> None:
         """Handle new job button click."""
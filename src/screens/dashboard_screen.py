@@ -1,5 +1,7 @@
 """Main dashboard screen."""
 
+from typing import Dict
+
 from PyQt6.QtWidgets import (
     QVBoxLayout, QHBoxLayout, QLabel, QGridLayout,
     QGroupBox, QFrame
@@ -14,12 +16,55 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Sample recent activity, built once at import
+_ACTIVITY_HEADERS = ("Time", "Type", "Description", "Status")
+_ACTIVITY_ROWS = (
+    ("10:30 AM", "Job", "Payment File Conversion completed", "Success"),
+    ("10:15 AM", "Payment", "Payment PAY001 processed", "Success"),
+    ("10:00 AM", "Job", "Customer Data Import started", "Running"),
+    ("09:45 AM", "Log", "Error detected in log file", "Warning"),
+    ("09:30 AM", "XML", "XML validation completed", "Success"),
+)
+# Stat card accent colors, keyed by the value of each card's "accent" property
+_CARD_COLORS: Dict[str, str] = {
+    "green": "#4CAF50",
+    "blue": "#2196F3",
+    "red": "#F44336",
+    "orange": "#FF9800",
+}
+
+
+def _build_card_qss(colors: Dict[str, str]) -> str:
+    """
+    Build the stat card stylesheet.
+    
+    Args:
+        colors: Accent colors keyed by accent name
+        
+    Returns:
+        Stylesheet with one card rule and one value label rule per accent
+    """
+    rules = [
+        "QFrame#statCard { background-color: white; border-radius: 4px; padding: 10px; }",
+        'QLabel[statRole="title"] { color: #666; font-size: 12px; }',
+        'QLabel[statRole="value"] { font-size: 24px; font-weight: bold; }',
+    ]
+    for accent, color in colors.items():
+        rules.append(f'QFrame#statCard[accent="{accent}"] {{ border-left: 4px solid {color}; }}')
+        rules.append(f'QLabel[statRole="value"][accent="{accent}"] {{ color: {color}; }}')
+    return "\n".join(rules)
+
 
 class DashboardScreen(BaseScreen):
     """
     Main dashboard screen showing application overview.
     """
     
+    # Stat card styling, applied once to the screen; cards select an accent
+    # through their "accent" property
+    CARD_COLORS = _CARD_COLORS
+    CARD_QSS = _build_card_qss(_CARD_COLORS)
+    
     @property
     def screen_name(self) -> str:
         """Get screen name."""
@@ -32,25 +77,27 @@ class DashboardScreen(BaseScreen):
     
     def setup_ui(self) -> None:
         """Set up the user interface."""
-        layout = QVBoxLayout()
+        layout = QVBoxLayout(self)
+        self.setStyleSheet(self.CARD_QSS)
         
         # Title
         title_label = QLabel("<h1>Dashboard</h1>")
         layout.addWidget(title_label)
         
         # Summary cards
+        self._card_values: Dict[QFrame, QLabel] = {}
         cards_layout = QGridLayout()
         
-        self.jobs_card = self._create_stat_card("Active Jobs", "0", "#4CAF50")
+        self.jobs_card = self._create_stat_card("Active Jobs", "0", "green")
         cards_layout.addWidget(self.jobs_card, 0, 0)
         
-        self.payments_card = self._create_stat_card("Payments Today", "$0.00", "#2196F3")
+        self.payments_card = self._create_stat_card("Payments Today", "$0.00", "blue")
         cards_layout.addWidget(self.payments_card, 0, 1)
         
-        self.errors_card = self._create_stat_card("Errors", "0", "#F44336")
+        self.errors_card = self._create_stat_card("Errors", "0", "red")
         cards_layout.addWidget(self.errors_card, 0, 2)
         
-        self.records_card = self._create_stat_card("DB Records", "0", "#FF9800")
+        self.records_card = self._create_stat_card("DB Records", "0", "orange")
         cards_layout.addWidget(self.records_card, 0, 3)
         
         layout.addLayout(cards_layout)
@@ -60,73 +107,63 @@ class DashboardScreen(BaseScreen):
         
         # Jobs chart
         jobs_chart_group = QGroupBox("Job Status")
-        jobs_chart_layout = QVBoxLayout()
+        jobs_chart_layout = QVBoxLayout(jobs_chart_group)
         self.jobs_chart = ChartWidget()
         self.jobs_chart.setTitle("Conversion Jobs")
         self.jobs_chart.setMinimumHeight(250)
         jobs_chart_layout.addWidget(self.jobs_chart)
-        jobs_chart_group.setLayout(jobs_chart_layout)
         charts_layout.addWidget(jobs_chart_group)
         
         # Payments chart
         payments_chart_group = QGroupBox("Payment Analytics")
-        payments_chart_layout = QVBoxLayout()
+        payments_chart_layout = QVBoxLayout(payments_chart_group)
         self.payments_chart = ChartWidget()
         self.payments_chart.setTitle("Payments by Status")
         self.payments_chart.setMinimumHeight(250)
         payments_chart_layout.addWidget(self.payments_chart)
-        payments_chart_group.setLayout(payments_chart_layout)
         charts_layout.addWidget(payments_chart_group)
         
         layout.addLayout(charts_layout)
         
         # Recent activity
         activity_group = QGroupBox("Recent Activity")
-        activity_layout = QVBoxLayout()
+        activity_layout = QVBoxLayout(activity_group)
         self.activity_table = DataTable()
         activity_layout.addWidget(self.activity_table)
-        activity_group.setLayout(activity_layout)
         layout.addWidget(activity_group)
         
-        self.setLayout(layout)
-        
         logger.info("Dashboard screen UI initialized")
     
-    def _create_stat_card(self, title: str, value: str, color: str) -> QFrame:
+    def _create_stat_card(self, title: str, value: str, accent: str) -> QFrame:
         """
         Create a statistics card widget.
         
         Args:
             title: Card title
             value: Card value
-            color: Card color
+            accent: Accent name, a key of CARD_COLORS
             
         Returns:
             Card widget
         """
         card = QFrame()
         card.setFrameStyle(QFrame.Shape.StyledPanel | QFrame.Shadow.Raised)
-        card.setStyleSheet(f"""
-            QFrame {{
-                background-color: white;
-                border-left: 4px solid {color};
-                border-radius: 4px;
-                padding: 10px;
-            }}
-        """)
+        card.setObjectName("statCard")
+        card.setProperty("accent", accent)
         
-        card_layout = QVBoxLayout()
+        card_layout = QVBoxLayout(card)
         
         title_label = QLabel(title)
-        title_label.setStyleSheet("color: #666; font-size: 12px;")
+        title_label.setProperty("statRole", "title")
         card_layout.addWidget(title_label)
         
         value_label = QLabel(value)
-        value_label.setStyleSheet(f"color: {color}; font-size: 24px; font-weight: bold;")
+        value_label.setProperty("statRole", "value")
+        value_label.setProperty("accent", accent)
         value_label.setObjectName(f"{title.lower().replace(' ', '_')}_value")
         card_layout.addWidget(value_label)
         
-        card.setLayout(card_layout)
+        self._card_values[card] = value_label
         return card
     
     def load_data(self) -> None:
@@ -151,16 +188,7 @@ class DashboardScreen(BaseScreen):
         self.payments_chart.createBarChart(payment_categories, payment_data, "Status", "Count")
         
         # Update recent activity table
-        headers = ["Time", "Type", "Description", "Status"]
-        activity_data = [
-            ["10:30 AM", "Job", "Payment File Conversion completed", "Success"],
-            ["10:15 AM", "Payment", "Payment PAY001 processed", "Success"],
-            ["10:00 AM", "Job", "Customer Data Import started", "Running"],
-            ["09:45 AM", "Log", "Error detected in log file", "Warning"],
-            ["09:30 AM", "XML", "XML validation completed", "Success"],
-        ]
-        
-        self.activity_table.setData(activity_data, headers)
+        self.activity_table.setData(list(_ACTIVITY_ROWS), list(_ACTIVITY_HEADERS))
         
         logger.info("Dashboard data loaded")
     
@@ -172,13 +200,4 @@ class DashboardScreen(BaseScreen):
             card: Card widget
             value: New value
         """
-        # Find the value label in the card
-        for child in card.children():
-            if isinstance(child, QVBoxLayout):
-                for i in range(child.count()):
-                    item = child.itemAt(i)
-                    if item and item.widget():
-                        widget = item.widget()
-                        if isinstance(widget, QLabel) and "font-size: 24px" in widget.styleSheet():
-                            widget.setText(value)
-                            break
+        self._card_values[card].setText(value)
@@ -7,7 +7,7 @@ from PyQt6.QtCore import Qt
 
 from ..core.base_screen import BaseScreen
 from ..widgets.data_table import DataTable
-from ..widgets.filter_widget import FilterWidget
+from ..widgets.filter_widget import FilterProxyModel, FilterWidget
 from ..utils.logger import get_logger
 
 
@@ -31,7 +31,7 @@ class DBBrowserScreen(BaseScreen):
     
     def setup_ui(self) -> None:
         """Set up the user interface."""
-        layout = QVBoxLayout()
+        layout = QVBoxLayout(self)
         
         # Title
         title_label = QLabel("<h2>Database Browser</h2>")
@@ -45,15 +45,18 @@ class DBBrowserScreen(BaseScreen):
         self.filter_widget.filterChanged.connect(self._on_filter_changed)
         splitter.addWidget(self.filter_widget)
         
-        # Data table
+        # Data table, filtered through a proxy model
         self.data_table = DataTable()
+        self._proxy = FilterProxyModel(self)
+        self.data_table.setProxyModel(self._proxy)
         splitter.addWidget(self.data_table)
         
-        # Set splitter sizes (20% filter, 80% table)
+        # Split 20% filter, 80% table, keeping the ratio on resize
         splitter.setSizes([200, 800])
+        splitter.setStretchFactor(0, 1)
+        splitter.setStretchFactor(1, 4)
         
         layout.addWidget(splitter)
-        self.setLayout(layout)
         
         logger.info("DB Browser screen UI initialized")
     
@@ -78,14 +81,15 @@ class DBBrowserScreen(BaseScreen):
         """
         Handle filter changes.
         
+        Quick search typing is already debounced by the filter widget.
+        
         Args:
             field: Field to filter on
             operator: Filter operator
             value: Filter value
         """
-        logger.info(f"Filter changed: {field} {operator} {value}")
-        # In real implementation, this would filter the data
-        # For now, just log the filter change
+        self._proxy.set_filter(field, operator, value)
+        logger.info("Filter changed: %s %s %s", field, operator, value)
     
     def refresh(self) -> None:
         """Refresh screen data."""
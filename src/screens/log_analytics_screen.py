@@ -1,9 +1,12 @@
 """Log analytics screen with regex and file streaming support."""
 
-import re
+import mmap
 import os
-from pathlib import Path
-from typing import List, Optional
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+from typing import Any, AnyStr, Dict, Iterator, List, Optional, Tuple, Union
 
 from PyQt6.QtWidgets import (
     QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
@@ -15,9 +18,125 @@ from ..core.base_screen import BaseScreen
 from ..widgets.text_area import TextArea
 from ..utils.logger import get_logger
 
+try:
+    import re2  # Optional google-re2 engine for plain-text log searches
+except ImportError:
+    re2 = None
+
 
 logger = get_logger(__name__)
 
+# Compiled patterns by (pattern, flags); unlike re's own cache this is never
+# evicted by unrelated regex use elsewhere in the process
+_REGEX_CACHE: Dict[Tuple[Union[str, bytes], int], Any] = {}
+
+
+def _get_regex(pattern: AnyStr, flags: int = 0) -> Any:
+    """
+    Get a compiled regex, compiling it on first use.
+    
+    Bytes patterns without flags are compiled with RE2 when google-re2 is
+    installed; everything else uses the re module.
+    
+    Args:
+        pattern: Regex pattern
+        flags: re module flags
+        
+    Returns:
+        Compiled pattern with re's search(string, pos, endpos) interface
+    """
+    key = (pattern, flags)
+    regex = _REGEX_CACHE.get(key)
+    if regex is None:
+        regex = _REGEX_CACHE[key] = _compile_regex(pattern, flags)
+    return regex
+
+
+def _compile_regex(pattern: AnyStr, flags: int) -> Any:
+    """
+    Compile a pattern with RE2 if possible, otherwise with re.
+    
+    Only the flagless bytes literals that _search_regex runs over mapped
+    files go to RE2, which releases the GIL while it searches. Regexes and
+    case-insensitive searches need re's Unicode rules for case folding,
+    \\w and \\b, which RE2 does not follow.
+    """
+    if re2 is not None and isinstance(pattern, bytes) and not flags:
+        options = re2.Options()
+        options.log_errors = False
+        options.encoding = re2.Options.Encoding.LATIN1  # Byte semantics, as re
+        try:
+            return re2.compile(pattern, options)
+        except re2.error:
+            pass
+    return re.compile(pattern, flags)
+
+
+def _search_regex(pattern: str, is_regex: bool) -> Any:
+    """
+    Get the compiled regex used to search log files for a pattern.
+    
+    ASCII plain text without cased letters compiles to a bytes pattern that
+    is searched straight over the mapped file; such a literal matches UTF-8
+    data exactly where it matches the decoded text. Everything else
+    compiles to a str pattern and is searched in decoded text, so case
+    folding, ".", \\w and \\b follow Unicode rules as in the re module.
+    
+    Args:
+        pattern: Search pattern
+        is_regex: Whether pattern is a regex
+        
+    Returns:
+        Compiled bytes or str pattern
+    """
+    # MULTILINE keeps ^ and $ anchored to line boundaries
+    if is_regex:
+        return _get_regex(pattern, re.MULTILINE)
+    
+    # Plain text searches run as escaped case-insensitive regexes; text
+    # without cased letters (IDs, numbers, addresses) matches the same
+    # either way and takes the engine's fast literal scan
+    if pattern.lower() != pattern.upper():
+        return _get_regex(re.escape(pattern), re.IGNORECASE)
+    if pattern.isascii():
+        return _get_regex(re.escape(pattern.encode('ascii')))
+    return _get_regex(re.escape(pattern))
+
+
+# A matching log line: (line number, line text)
+LogMatch = Tuple[int, str]
+
+
+def _format_matches(matches: List[LogMatch]) -> str:
+    """
+    Format matches for display, one "line number: line" per line.
+    
+    Args:
+        matches: Matches to format
+        
+    Returns:
+        Formatted text
+    """
+    return "\n".join(f"{line_number}: {line}" for line_number, line in matches)
+
+
+# Preset search patterns: name -> (pattern, is_regex)
+_PRESET_PATTERNS: Dict[str, Tuple[str, bool]] = {
+    "Error Messages": (r"\b(error|ERROR|Error)\b", True),
+    "Warning Messages": (r"\b(warning|WARNING|Warning|warn|WARN)\b", True),
+    "Exception Stack Traces": (r"Exception|Traceback|at \w+\.\w+\(", True),
+    "Database Queries": (r"(SELECT|INSERT|UPDATE|DELETE|CREATE|DROP)\b", True),
+    "HTTP Requests": (r"(GET|POST|PUT|DELETE|PATCH)\s+/\S+", True),
+    "Email Addresses": (r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b", True),
+    "IP Addresses": (r"\b(?:\d{1,3}\.){3}\d{1,3}\b", True),
+    "Timestamps": (r"\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}", True),
+}
+
+# Compile the presets once, up front
+for _pattern, _is_regex in _PRESET_PATTERNS.values():
+    _search_regex(_pattern, _is_regex)
+del _pattern, _is_regex
+
 
 class LogAnalyzerThread(QThread):
     """
@@ -27,7 +146,20 @@ class LogAnalyzerThread(QThread):
     """
     
     progress = pyqtSignal(str)
-    finished = pyqtSignal(list)
+    partial = pyqtSignal(list, int)  # New LogMatch tuples, total matches so far
+    finished = pyqtSignal(int)  # Total matches
+    
+    # Matching lines kept per search; further matches are only counted
+    MAX_RESULTS = 1000
+    
+    # Matches between partial result updates
+    BATCH_SIZE = 1000
+    
+    # File extensions searched in directory mode
+    LOG_EXTENSIONS = ('.log', '.txt')
+    
+    # Bytes searched between cancellation checks
+    SCAN_WINDOW_SIZE = 16 * 1024 * 1024
     
     def __init__(self, file_path: str, pattern: str, is_regex: bool, is_directory: bool):
         """
@@ -44,36 +176,133 @@ class LogAnalyzerThread(QThread):
         self.pattern = pattern
         self.is_regex = is_regex
         self.is_directory = is_directory
-        self._running = True
+        self._stop = threading.Event()
     
     def run(self) -> None:
         """Run the analysis."""
         try:
-            results = []
-            
+            _search_regex(self.pattern, self.is_regex)
+        except re.error as e:
+            logger.warning("Invalid search pattern %r: %s", self.pattern, e)
+            # Finish first so the error stays in the status line
+            self.finished.emit(0)
+            self.progress.emit(f"Invalid pattern: {e}")
+            return
+        
+        try:
             if self.is_directory:
                 # Process all log files in directory
-                log_dir = Path(self.file_path)
-                log_files = list(log_dir.glob("*.log")) + list(log_dir.glob("*.txt"))
-                
-                for log_file in log_files:
-                    if not self._running:
-                        break
-                    self.progress.emit(f"Processing {log_file.name}...")
-                    file_results = self._analyze_file(str(log_file))
-                    results.extend(file_results)
+                total = self._analyze_files(self._list_log_files())
             else:
-                # Process single file
+                # Process single file, streaming matches as they are found
                 self.progress.emit(f"Processing file...")
-                results = self._analyze_file(self.file_path)
+                total = 0
+                batch = []
+                for match in self._scan_file(self.file_path):
+                    total += 1
+                    if total <= self.MAX_RESULTS:
+                        batch.append(match)
+                    if total % self.BATCH_SIZE == 0:
+                        self.partial.emit(batch, total)
+                        batch = []
+                if batch or total % self.BATCH_SIZE:
+                    self.partial.emit(batch, total)
             
-            self.finished.emit(results)
+            self.finished.emit(total)
             
         except Exception as e:
-            logger.error(f"Error analyzing logs: {e}", exc_info=True)
+            logger.error("Error analyzing logs: %s", e, exc_info=True)
             self.progress.emit(f"Error: {str(e)}")
     
-    def _analyze_file(self, file_path: str) -> List[str]:
+    def _list_log_files(self) -> List[str]:
+        """
+        List the log files in the analyzed directory.
+        
+        The directory is read in a single scandir pass; file types come from
+        the directory entries, so no extra stat calls are needed. Stopping
+        the analysis abandons the listing at the next entry.
+        
+        Returns:
+            Paths of the *.log and *.txt files sorted by name, or an empty
+            list if the analysis was stopped
+        """
+        log_files = []
+        with os.scandir(self.file_path) as entries:
+            for entry in entries:
+                if self._stop.is_set():
+                    return []
+                if (entry.name.endswith(self.LOG_EXTENSIONS)
+                        and entry.is_file(follow_symlinks=False)):
+                    log_files.append(entry.path)
+        return sorted(log_files)
+    
+    def _analyze_files(self, log_files: List[str]) -> int:
+        """
+        Analyze several log files.
+        
+        Results are emitted through partial, in file order, as files finish.
+        
+        Args:
+            log_files: Log files to analyze
+            
+        Returns:
+            Total number of matches
+        """
+        file_results: Dict[int, Tuple[List[LogMatch], int]] = {}
+        next_file = 0
+        total = 0
+        kept = 0
+        
+        for index, result in self._iter_file_results(log_files):
+            file_results[index] = result
+            self.progress.emit(f"Processed {os.path.basename(log_files[index])}")
+            
+            # Emit every file whose predecessors have all been emitted
+            while next_file in file_results:
+                matches, count = file_results.pop(next_file)
+                matches = matches[:max(self.MAX_RESULTS - kept, 0)]
+                kept += len(matches)
+                total += count
+                self.partial.emit(matches, total)
+                next_file += 1
+        
+        return total
+    
+    def _iter_file_results(self, log_files: List[str]) -> Iterator[Tuple[int, Tuple[List[LogMatch], int]]]:
+        """
+        Analyze log files, in parallel when the search engine allows it.
+        
+        The re module holds the GIL while it scans, so re searches run one
+        file after another. RE2 releases it, so plain-text searches without
+        cased letters (IDs, numbers) run on a thread pool when google-re2
+        is installed. Iteration ends early once the analysis is stopped.
+        
+        Args:
+            log_files: Log files to analyze
+            
+        Yields:
+            (index in log_files, analysis result) as files finish
+        """
+        regex = _search_regex(self.pattern, self.is_regex)
+        if isinstance(regex, re.Pattern) or len(log_files) < 2:
+            for index, log_file in enumerate(log_files):
+                if self._stop.is_set():
+                    return
+                yield index, self._analyze_file(log_file)
+            return
+        
+        workers = min(os.cpu_count() or 1, len(log_files))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(self._analyze_file, log_file): index
+                       for index, log_file in enumerate(log_files)}
+            for future in as_completed(futures):
+                if self._stop.is_set():
+                    for pending in futures:
+                        pending.cancel()
+                    return
+                yield futures[future], future.result()
+    
+    def _analyze_file(self, file_path: str) -> Tuple[List[LogMatch], int]:
         """
         Analyze a single log file.
         
@@ -81,61 +310,109 @@ class LogAnalyzerThread(QThread):
             file_path: Path to log file
             
         Returns:
-            List of matching lines
+            Up to MAX_RESULTS matches, and the total number of matches
+        """
+        scan = self._scan_file(file_path)
+        matches = list(islice(scan, self.MAX_RESULTS))
+        return matches, len(matches) + sum(1 for _ in scan)
+    
+    def _scan_file(self, file_path: str) -> Iterator[LogMatch]:
         """
-        results = []
-        line_number = 0
+        Search a single log file.
         
-        # Use streaming to handle large files (>6GB)
-        chunk_size = 1024 * 1024  # 1MB chunks
+        The file is memory-mapped and searched one window of whole lines at
+        a time, so the regex engine scans the data in C. Bytes patterns run
+        directly over the map and only matching lines are decoded; str
+        patterns run over each decoded window. Matches are confined to a
+        line and each line is reported at most once.
         
+        Args:
+            file_path: Path to log file
+            
+        Yields:
+            (line number, line) for each matching line
+        """
         try:
-            if self.is_regex:
-                regex = re.compile(self.pattern)
+            regex = _search_regex(self.pattern, self.is_regex)
+            text_mode = isinstance(regex.pattern, str)
+            newline, carriage_return = ('\n', '\r') if text_mode else (b'\n', b'\r')
             
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                buffer = ""
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return
                 
-                while self._running:
-                    chunk = f.read(chunk_size)
-                    if not chunk:
-                        break
-                    
-                    buffer += chunk
-                    lines = buffer.split('\n')
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # The map is read front to back once; let the kernel read
+                    # ahead aggressively (not available on every platform)
+                    if hasattr(mmap, "MADV_SEQUENTIAL"):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
                     
-                    # Keep last incomplete line in buffer
-                    buffer = lines[-1]
-                    lines = lines[:-1]
+                    line_number = 1  # Line containing offset `counted`
                     
-                    for line in lines:
-                        line_number += 1
-                        
-                        if self.is_regex:
-                            if regex.search(line):
-                                results.append(f"{line_number}: {line}")
+                    for pos, end in self._iter_windows(mm):
+                        if text_mode:
+                            # Windows end at a newline, never inside a character
+                            data = mm[pos:end].decode('utf-8', 'ignore')
+                            pos, end = 0, len(data)
                         else:
-                            if self.pattern.lower() in line.lower():
-                                results.append(f"{line_number}: {line}")
-                
-                # Process last line
-                if buffer and self._running:
-                    line_number += 1
-                    if self.is_regex:
-                        if regex.search(buffer):
-                            results.append(f"{line_number}: {buffer}")
-                    else:
-                        if self.pattern.lower() in buffer.lower():
-                            results.append(f"{line_number}: {buffer}")
+                            data = mm
+                        counted = pos
+                        
+                        match = regex.search(data, pos, end)
+                        while match:
+                            start = match.start()
+                            # Windows end just after a newline; an empty match
+                            # there is the start of the next window, or past
+                            # the last line of the file
+                            if start == end and data[end - 1:end] == newline:
+                                break
+                            line_start = data.rfind(newline, pos, start) + 1 or pos
+                            line_end = data.find(newline, start, end)
+                            if line_end < 0:
+                                line_end = end
+                            line = data[line_start:line_end]
+                            
+                            # A match running past the end of its line (\s
+                            # matches newlines) only counts if the line
+                            # matches on its own
+                            if match.end() <= line_end or regex.search(line):
+                                line_number += data[counted:line_start].count(newline)
+                                counted = line_start
+                                
+                                line = line.rstrip(carriage_return)
+                                yield line_number, line if text_mode else line.decode('utf-8', 'ignore')
+                            
+                            match = regex.search(data, line_end + 1, end) if line_end + 1 < end else None
+                        
+                        line_number += data[counted:end].count(newline)
         
         except Exception as e:
-            logger.error(f"Error reading file {file_path}: {e}")
+            logger.error("Error reading file %s: %s", file_path, e)
+    
+    def _iter_windows(self, mm: mmap.mmap) -> Iterator[Tuple[int, int]]:
+        """
+        Split a mapped file into scan windows of whole lines.
         
-        return results
+        Iteration ends early once the analysis is stopped.
+        
+        Args:
+            mm: Mapped log file
+            
+        Yields:
+            (start, end) byte offsets of each window
+        """
+        size = len(mm)
+        pos = 0
+        while pos < size and not self._stop.is_set():
+            # Window ends at a line boundary
+            end = mm.find(b'\n', min(pos + self.SCAN_WINDOW_SIZE, size - 1))
+            end = size if end < 0 else end + 1
+            yield pos, end
+            pos = end
     
     def stop(self) -> None:
         """Stop the analysis."""
-        self._running = False
+        self._stop.set()
 
 
 class LogAnalyticsScreen(BaseScreen):
@@ -206,17 +483,7 @@ class LogAnalyticsScreen(BaseScreen):
         preset_layout = QHBoxLayout()
         preset_layout.addWidget(QLabel("Presets:"))
         self.preset_combo = QComboBox()
-        self.preset_combo.addItems([
-            "Custom",
-            "Error Messages",
-            "Warning Messages",
-            "Exception Stack Traces",
-            "Database Queries",
-            "HTTP Requests",
-            "Email Addresses",
-            "IP Addresses",
-            "Timestamps"
-        ])
+        self.preset_combo.addItems(["Custom", *_PRESET_PATTERNS])
         self.preset_combo.currentTextChanged.connect(self._on_preset_changed)
         preset_layout.addWidget(self.preset_combo)
         preset_layout.addStretch()
@@ -252,18 +519,7 @@ class LogAnalyticsScreen(BaseScreen):
         self.setLayout(layout)
         
         self._analyzer_thread: Optional[LogAnalyzerThread] = None
-        
-        # Preset patterns
-        self._preset_patterns = {
-            "Error Messages": (r"\b(error|ERROR|Error)\b", True),
-            "Warning Messages": (r"\b(warning|WARNING|Warning|warn|WARN)\b", True),
-            "Exception Stack Traces": (r"Exception|Traceback|at \w+\.\w+\(", True),
-            "Database Queries": (r"(SELECT|INSERT|UPDATE|DELETE|CREATE|DROP)\b", True),
-            "HTTP Requests": (r"(GET|POST|PUT|DELETE|PATCH)\s+/\S+", True),
-            "Email Addresses": (r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b", True),
-            "IP Addresses": (r"\b(?:\d{1,3}\.){3}\d{1,3}\b", True),
-            "Timestamps": (r"\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}", True),
-        }
+        self._matches: List[LogMatch] = []
         
         logger.info("Log Analytics screen UI initialized")
     
@@ -283,7 +539,7 @@ class LogAnalyticsScreen(BaseScreen):
         
         if file_path:
             self.path_input.setText(file_path)
-            logger.info(f"Selected log file: {file_path}")
+            logger.info("Selected log file: %s", file_path)
     
     def _on_browse_dir_clicked(self) -> None:
         """Handle browse directory button click."""
@@ -294,7 +550,7 @@ class LogAnalyticsScreen(BaseScreen):
         
         if dir_path:
             self.path_input.setText(dir_path)
-            logger.info(f"Selected log directory: {dir_path}")
+            logger.info("Selected log directory: %s", dir_path)
     
     def _on_preset_changed(self, preset: str) -> None:
         """
@@ -303,8 +559,8 @@ class LogAnalyticsScreen(BaseScreen):
         Args:
             preset: Selected preset name
         """
-        if preset in self._preset_patterns:
-            pattern, is_regex = self._preset_patterns[preset]
+        if preset in _PRESET_PATTERNS:
+            pattern, is_regex = _PRESET_PATTERNS[preset]
             self.pattern_input.setText(pattern)
             self.regex_checkbox.setChecked(is_regex)
     
@@ -327,7 +583,9 @@ class LogAnalyticsScreen(BaseScreen):
         # Start analysis thread
         self._analyzer_thread = LogAnalyzerThread(file_path, pattern, is_regex, is_directory)
         self._analyzer_thread.progress.connect(self._on_analysis_progress)
+        self._analyzer_thread.partial.connect(self._on_analysis_partial)
         self._analyzer_thread.finished.connect(self._on_analysis_finished)
+        self._matches = []
         self._analyzer_thread.start()
         
         self.search_button.setEnabled(False)
@@ -335,7 +593,7 @@ class LogAnalyticsScreen(BaseScreen):
         self.status_label.setText("Analyzing...")
         self.results_text.setText("Searching...\n")
         
-        logger.info(f"Started log analysis: {file_path} with pattern: {pattern}")
+        logger.info("Started log analysis: %s with pattern: %s", file_path, pattern)
     
     def _on_cancel_clicked(self) -> None:
         """Handle cancel button click."""
@@ -355,29 +613,43 @@ class LogAnalyticsScreen(BaseScreen):
         """
         self.status_label.setText(message)
     
-    def _on_analysis_finished(self, results: List[str]) -> None:
+    def _on_analysis_partial(self, matches: List[LogMatch], total: int) -> None:
+        """
+        Handle a batch of analysis results.
+        
+        Args:
+            matches: New matches (the thread stops sending matches after
+                LogAnalyzerThread.MAX_RESULTS, but keeps counting)
+            total: Total matches so far
+        """
+        if matches:
+            self._matches.extend(matches)
+            self.results_text.appendText(_format_matches(matches))
+        self.status_label.setText(f"Analyzing... {total} matches so far")
+    
+    def _on_analysis_finished(self, total: int) -> None:
         """
         Handle analysis completion.
         
         Args:
-            results: List of matching lines
+            total: Total number of matches
         """
         self.search_button.setEnabled(True)
         self.cancel_button.setEnabled(False)
         
-        if results:
-            self.results_text.setText(f"Found {len(results)} matches:\n\n")
-            self.results_text.appendText("\n".join(results[:1000]))  # Limit display to first 1000
-            
-            if len(results) > 1000:
-                self.results_text.appendText(f"\n\n... and {len(results) - 1000} more matches")
+        if total:
+            # Build the final text once so the view is laid out in a single pass
+            text = f"Found {total} matches:\n\n{_format_matches(self._matches)}"
+            if total > len(self._matches):
+                text += f"\n\n... and {total - len(self._matches)} more matches"
+            self.results_text.setText(text)
             
-            self.status_label.setText(f"Analysis complete: {len(results)} matches found")
+            self.status_label.setText(f"Analysis complete: {total} matches found")
         else:
             self.results_text.setText("No matches found")
             self.status_label.setText("Analysis complete: No matches found")
         
-        logger.info(f"Log analysis complete: {len(results)} matches found")
+        logger.info("Log analysis complete: %s matches found", total)
     
     def cleanup(self) -> None:
         """Clean up resources."""
@@ -1,9 +1,8 @@
 """Payments screen."""
 
 from datetime import datetime
-from decimal import Decimal
 
-from PyQt6.QtWidgets import QVBoxLayout, QHBoxLayout, QLabel, QPushButton
+from PyQt6.QtWidgets import QVBoxLayout, QHBoxLayout, QLabel
 from PyQt6.QtCore import Qt
 
 from ..core.base_screen import BaseScreen
@@ -41,9 +40,7 @@ class PaymentsScreen(BaseScreen):
         header_layout.addWidget(title_label)
         header_layout.addStretch()
         
-        refresh_button = QPushButton("Refresh")
-        refresh_button.clicked.connect(self.refresh)
-        header_layout.addWidget(refresh_button)
+        header_layout.addWidget(self._create_refresh_button())
         
         layout.addLayout(header_layout)
         
@@ -67,7 +64,7 @@ class PaymentsScreen(BaseScreen):
         payments = [
             Payment(
                 payment_id="PAY001",
-                amount=Decimal("100.50"),
+                amount_cents=10050,
                 currency="USD",
                 status=PaymentStatus.COMPLETED,
                 method=PaymentMethod.CREDIT_CARD,
@@ -76,7 +73,7 @@ class PaymentsScreen(BaseScreen):
             ),
             Payment(
                 payment_id="PAY002",
-                amount=Decimal("250.00"),
+                amount_cents=25000,
                 currency="USD",
                 status=PaymentStatus.COMPLETED,
                 method=PaymentMethod.BANK_TRANSFER,
@@ -85,7 +82,7 @@ class PaymentsScreen(BaseScreen):
             ),
             Payment(
                 payment_id="PAY003",
-                amount=Decimal("75.25"),
+                amount_cents=7525,
                 currency="USD",
                 status=PaymentStatus.PENDING,
                 method=PaymentMethod.PAYPAL,
@@ -103,7 +100,7 @@ class PaymentsScreen(BaseScreen):
                 p.formatted_amount,
                 p.method.value,
                 p.status.value,
-                p.created_at.strftime("%Y-%m-%d %H:%M")
+                p.created_at.isoformat(" ", "minutes")
             ]
             for p in payments
         ]
@@ -108,7 +108,7 @@ class SearchScreen(BaseScreen):
             self.results_label.setText("Please enter a search term")
             return
         
-        logger.info(f"Searching for '{search_term}' in {search_scope}")
+        logger.info("Searching for '%s' in %s", search_term, search_scope)
         
         # Sample search results
         results = [
@@ -122,4 +122,4 @@ class SearchScreen(BaseScreen):
         
         self.results_label.setText(f"Found {len(results)} results for '{search_term}' in {search_scope}")
         
-        logger.info(f"Search complete: {len(results)} results found")
+        logger.info("Search complete: %s results found", len(results))
@@ -1,13 +1,14 @@
 """XML issues helper screen."""
 
 import xml.etree.ElementTree as ET
-from xml.dom import minidom
+from collections import Counter
+from typing import Dict, Optional, Tuple
 
 from PyQt6.QtWidgets import (
     QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QFileDialog, QGroupBox, QSplitter
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
 
 from ..core.base_screen import BaseScreen
 from ..widgets.text_area import TextArea
@@ -17,6 +18,42 @@ from ..utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+class XMLFileLoaderSignals(QObject):
+    """Signals emitted by XMLFileLoader."""
+    
+    loaded = pyqtSignal(str, str)  # file_path, content
+    failed = pyqtSignal(str, str)  # file_path, error message
+
+
+class XMLFileLoader(QRunnable):
+    """
+    Runnable that reads and decodes an XML file off the GUI thread.
+    """
+    
+    def __init__(self, file_path: str):
+        """
+        Initialize the loader.
+        
+        Args:
+            file_path: Path to XML file
+        """
+        super().__init__()
+        self.file_path = file_path
+        self.signals = XMLFileLoaderSignals()
+    
+    def run(self) -> None:
+        """Read the file."""
+        try:
+            with open(self.file_path, 'rb') as f:
+                content = f.read().decode('utf-8')
+        except Exception as e:
+            logger.error("Error loading XML file: %s", e, exc_info=True)
+            self.signals.failed.emit(self.file_path, str(e))
+            return
+        
+        self.signals.loaded.emit(self.file_path, content)
+
+
 class XMLHelperScreen(BaseScreen):
     """
     XML issues helper screen for validating and fixing XML files.
@@ -86,6 +123,11 @@ class XMLHelperScreen(BaseScreen):
         layout.addWidget(splitter)
         self.setLayout(layout)
         
+        # File the editor content was loaded from, while it is unchanged
+        self._loaded_path: Optional[str] = None
+        # File currently being read in the background
+        self._loading_path: Optional[str] = None
+        
         logger.info("XML Helper screen UI initialized")
     
     def load_data(self) -> None:
@@ -99,6 +141,7 @@ class XMLHelperScreen(BaseScreen):
 </data>"""
         
         self.input_text.setText(sample_xml)
+        self._loaded_path = None
         self.output_text.setText("Ready. Load or enter XML to validate.")
         
         logger.info("XML Helper screen loaded")
@@ -113,38 +156,71 @@ class XMLHelperScreen(BaseScreen):
         )
         
         if file_path:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                self.input_text.setText(content)
-                self.output_text.setText(f"Loaded: {file_path}")
-                logger.info(f"Loaded XML file: {file_path}")
-                
-            except Exception as e:
-                self.output_text.setText(f"Error loading file: {str(e)}")
-                logger.error(f"Error loading XML file: {e}", exc_info=True)
+            self._loading_path = file_path
+            self.output_text.setText(f"Loading: {file_path}")
+            
+            loader = XMLFileLoader(file_path)
+            loader.signals.loaded.connect(self._on_file_loaded)
+            loader.signals.failed.connect(self._on_file_load_failed)
+            QThreadPool.globalInstance().start(loader)
+    
+    def _on_file_loaded(self, file_path: str, content: str) -> None:
+        """
+        Show a file read by XMLFileLoader.
+        
+        Args:
+            file_path: Path of the loaded file
+            content: File content
+        """
+        if file_path != self._loading_path:
+            return  # A newer load has been started since
+        
+        self._loading_path = None
+        self.input_text.setText(content)
+        self._loaded_path = file_path
+        self.output_text.setText(f"Loaded: {file_path}")
+        logger.info("Loaded XML file: %s", file_path)
+    
+    def _on_file_load_failed(self, file_path: str, message: str) -> None:
+        """
+        Report a file XMLFileLoader could not read.
+        
+        Args:
+            file_path: Path of the file
+            message: Error message
+        """
+        if file_path != self._loading_path:
+            return
+        
+        self._loading_path = None
+        self.output_text.setText(f"Error loading file: {message}")
     
     def _on_validate_clicked(self) -> None:
         """Handle validate button click."""
-        xml_content = self.input_text.getText()
+        # A loaded file that has not been edited is validated straight from
+        # disk, streaming, instead of parsing the editor text into a tree
+        from_file = self._loaded_path is not None and not self.input_text.document().isModified()
         
-        if not xml_content.strip():
-            self.output_text.setText("Error: No XML content to validate")
-            return
+        if not from_file:
+            xml_content = self.input_text.getText()
+            
+            if not xml_content.strip():
+                self.output_text.setText("Error: No XML content to validate")
+                return
         
         try:
-            # Parse XML
-            root = ET.fromstring(xml_content)
-            
-            # Get validation info
-            tag_counts = {}
-            self._count_tags(root, tag_counts)
+            # Parse XML and get validation info
+            if from_file:
+                root_tag, root_attrib, tag_counts = self._scan_xml_file(self._loaded_path)
+            else:
+                root = ET.fromstring(xml_content)
+                root_tag, root_attrib = root.tag, root.attrib
+                tag_counts = Counter(element.tag for element in root.iter())
             
             # Build output
             output = "✓ XML is well-formed and valid\n\n"
-            output += f"Root element: {root.tag}\n"
-            output += f"Root attributes: {root.attrib}\n\n"
+            output += f"Root element: {root_tag}\n"
+            output += f"Root attributes: {root_attrib}\n\n"
             output += "Tag statistics:\n"
             
             for tag, count in sorted(tag_counts.items()):
@@ -162,24 +238,49 @@ class XMLHelperScreen(BaseScreen):
             error_msg += "- Mismatched opening/closing tags\n"
             
             self.output_text.setText(error_msg)
-            logger.warning(f"XML validation failed: {e}")
+            logger.warning("XML validation failed: %s", e)
             
         except Exception as e:
             self.output_text.setText(f"✗ Error: {str(e)}")
-            logger.error(f"XML validation error: {e}", exc_info=True)
+            logger.error("XML validation error: %s", e, exc_info=True)
     
-    def _count_tags(self, element: ET.Element, counts: dict) -> None:
+    @staticmethod
+    def _scan_xml_file(file_path: str) -> Tuple[str, Dict[str, str], Counter]:
         """
-        Count tag occurrences recursively.
+        Check an XML file is well-formed and count its tags, streaming.
+        
+        Elements are cleared as soon as they are counted, so memory use
+        does not grow with the size of the file.
         
         Args:
-            element: XML element
-            counts: Dictionary to store counts
+            file_path: Path to XML file
+            
+        Returns:
+            Root tag, root attributes and tag counts
+            
+        Raises:
+            ET.ParseError: If the file is not well-formed XML
         """
-        counts[element.tag] = counts.get(element.tag, 0) + 1
+        root = None
+        root_attrib: Dict[str, str] = {}
+        tag_counts: Counter = Counter()
+        depth = 0
         
-        for child in element:
-            self._count_tags(child, counts)
+        for event, element in ET.iterparse(file_path, events=("start", "end")):
+            if event == "start":
+                if root is None:
+                    root = element
+                    root_attrib = dict(element.attrib)
+                depth += 1
+            else:
+                depth -= 1
+                tag_counts[element.tag] += 1
+                element.clear()
+                if depth == 1:
+                    # Drop finished children so the root does not keep them
+                    root.clear()
+        
+        return root.tag, root_attrib, tag_counts
     
     def _on_format_clicked(self) -> None:
         """Handle format button click."""
@@ -190,25 +291,20 @@ class XMLHelperScreen(BaseScreen):
             return
         
         try:
-            # Parse and format XML
+            # Parse and pretty print XML in place; indent() replaces the
+            # whitespace-only text between elements, so no blank lines remain
             root = ET.fromstring(xml_content)
-            xml_str = ET.tostring(root, encoding='unicode')
-            
-            # Pretty print
-            dom = minidom.parseString(xml_str)
-            formatted = dom.toprettyxml(indent="  ")
-            
-            # Remove empty lines
-            lines = [line for line in formatted.split('\n') if line.strip()]
-            formatted = '\n'.join(lines)
+            ET.indent(root, space="  ")
+            formatted = ET.tostring(root, encoding='unicode', xml_declaration=True)
             
             self.input_text.setText(formatted)
+            self._loaded_path = None
             self.output_text.setText("✓ XML formatted successfully")
             logger.info("XML formatted successfully")
             
         except Exception as e:
             self.output_text.setText(f"✗ Error formatting XML: {str(e)}")
-            logger.error(f"XML formatting error: {e}", exc_info=True)
+            logger.error("XML formatting error: %s", e, exc_info=True)
     
     def _on_save_clicked(self) -> None:
         """Handle save button click."""
@@ -227,8 +323,8 @@ class XMLHelperScreen(BaseScreen):
                     f.write(xml_content)
                 
                 self.output_text.setText(f"✓ Saved to: {file_path}")
-                logger.info(f"Saved XML file: {file_path}")
+                logger.info("Saved XML file: %s", file_path)
                 
             except Exception as e:
                 self.output_text.setText(f"✗ Error saving file: {str(e)}")
-                logger.error(f"Error saving XML file: {e}", exc_info=True)
+                logger.error("Error saving XML file: %s", e, exc_info=True)
@@ -78,10 +78,7 @@ def error_handler(
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                logger.error(
-                    f"Error in {func.__name__}: {str(e)}",
-                    exc_info=True
-                )
+                logger.error("Error in %s: %s", func.__name__, e, exc_info=True)
                 if show_dialog:
                     show_error_dialog(
                         parent,
@@ -1,15 +1,33 @@
 """Logging utilities for the application."""
 
+import atexit
 import logging
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
+
+
+# Background file writers, keyed by logger name
+_listeners: Dict[str, QueueListener] = {}
+
+
+def default_log_path() -> str:
+    """
+    Get the default application log file path.
+    
+    Returns:
+        Path to ~/.conversion-gui/app.log
+    """
+    return str(Path.home() / ".conversion-gui" / "app.log")
 
 
 def setup_logger(
     name: str,
     log_file: Optional[str] = None,
-    level: int = logging.INFO
+    level: int = logging.INFO,
+    background: bool = False
 ) -> logging.Logger:
     """
     Set up and configure a logger instance.
@@ -18,6 +36,8 @@ def setup_logger(
         name: Name of the logger
         log_file: Optional path to log file
         level: Logging level (default: INFO)
+        background: Write the log file from a background thread so logging
+            calls never block on disk I/O
         
     Returns:
         Configured logger instance
@@ -27,6 +47,7 @@ def setup_logger(
     
     # Remove existing handlers
     logger.handlers.clear()
+    _stop_listener(name)
     
     # Create formatter
     formatter = logging.Formatter(
@@ -47,11 +68,45 @@ def setup_logger(
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        
+        if background:
+            log_queue: queue.SimpleQueue = queue.SimpleQueue()
+            listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+            listener.start()
+            _listeners[name] = listener
+            
+            queue_handler = QueueHandler(log_queue)
+            queue_handler.setLevel(level)
+            logger.addHandler(queue_handler)
+        else:
+            logger.addHandler(file_handler)
     
     return logger
 
 
+def _stop_listener(name: str) -> None:
+    """
+    Stop the background file writer for a logger, if any.
+    
+    Args:
+        name: Name of the logger
+    """
+    listener = _listeners.pop(name, None)
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+def stop_background_logging() -> None:
+    """Flush and stop all background file writers."""
+    for name in list(_listeners):
+        _stop_listener(name)
+
+
+atexit.register(stop_background_logging)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance by name.
@@ -1,14 +1,101 @@
 """Settings management for the application."""
 
+import copy
 import json
+import mmap
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, BinaryIO, Dict, Optional, Tuple
 
 from .logger import get_logger
 
+try:
+    import orjson  # Optional faster JSON encoder/decoder
+except ImportError:
+    orjson = None
+
 
 logger = get_logger(__name__)
 
+# Cached result for keys that are not set
+_MISSING = object()
+
+# Default settings; never handed out directly, every use gets a deep copy so
+# changes to nested values cannot leak back into the defaults
+_DEFAULTS: Dict[str, Any] = {
+    "window": {
+        "width": 1280,
+        "height": 720,
+        "maximized": False
+    },
+    "theme": "light",
+    "log_level": "INFO",
+    "plugins_enabled": True,
+    "recent_files": [],
+    "database": {
+        "type": "sqlite",
+        "path": ""
+    }
+}
+
+
+@lru_cache(maxsize=256)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """
+    Split a dotted setting key into its parts.
+    
+    Args:
+        key: Setting key (e.g., 'window.width')
+        
+    Returns:
+        Key parts (e.g., ('window', 'width'))
+    """
+    return tuple(key.split('.'))
+
+
+def _dumps(settings: Dict[str, Any]) -> bytes:
+    """
+    Serialize settings to indented UTF-8 JSON.
+    
+    Non-string dict keys are written as strings with either encoder.
+    
+    Args:
+        settings: Settings to serialize
+        
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(settings, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(settings, indent=2).encode('utf-8')
+
+
+# Parse a JSON document from bytes
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Settings files larger than this are parsed straight from a memory map
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def _load_file(f: BinaryIO) -> Any:
+    """
+    Parse a settings file.
+    
+    With orjson, large files are parsed from a memory-mapped view instead of
+    being read into an intermediate bytes object first.
+    
+    Args:
+        f: Settings file opened in binary mode
+        
+    Returns:
+        Parsed JSON document
+    """
+    if orjson is not None and os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+    return _loads(f.read())
+
 
 class Settings:
     """
@@ -17,6 +104,8 @@ class Settings:
     Handles loading, saving, and accessing application settings.
     """
     
+    __slots__ = ('settings_file', '_settings', '_cache', '_loaded_mtime_ns')
+    
     def __init__(self, settings_file: Optional[str] = None):
         """
         Initialize the settings manager.
@@ -30,46 +119,59 @@ class Settings:
             self.settings_file = Path(settings_file)
         
         self._settings: Dict[str, Any] = {}
-        self._defaults: Dict[str, Any] = {
-            "window": {
-                "width": 1280,
-                "height": 720,
-                "maximized": False
-            },
-            "theme": "light",
-            "log_level": "INFO",
-            "plugins_enabled": True,
-            "recent_files": [],
-            "database": {
-                "type": "sqlite",
-                "path": ""
-            }
-        }
+        self._cache: Dict[str, Any] = {}  # Resolved values by dotted key
+        self._loaded_mtime_ns: Optional[int] = None  # File version in _settings
         self.load()
     
     def load(self) -> None:
-        """Load settings from file."""
+        """
+        Load settings from file.
+        
+        The file is not parsed again if it is unchanged since it was last
+        loaded or saved and no setting has been changed in memory since.
+        """
         try:
             if self.settings_file.exists():
-                with open(self.settings_file, 'r') as f:
-                    self._settings = json.load(f)
-                logger.info(f"Settings loaded from {self.settings_file}")
+                mtime_ns = self.settings_file.stat().st_mtime_ns
+                if mtime_ns == self._loaded_mtime_ns:
+                    return
+                with open(self.settings_file, 'rb') as f:
+                    self._settings = _load_file(f)
+                self._loaded_mtime_ns = mtime_ns
+                logger.info("Settings loaded from %s", self.settings_file)
             else:
-                self._settings = self._defaults.copy()
+                self._settings = copy.deepcopy(_DEFAULTS)
+                self._loaded_mtime_ns = None
                 logger.info("Using default settings")
         except Exception as e:
-            logger.error(f"Error loading settings: {e}")
-            self._settings = self._defaults.copy()
+            logger.error("Error loading settings: %s", e)
+            self._settings = copy.deepcopy(_DEFAULTS)
+            self._loaded_mtime_ns = None
+        self._cache.clear()
     
     def save(self) -> None:
-        """Save settings to file."""
+        """
+        Save settings to file.
+        
+        The settings are serialized first and written to a temporary file
+        that then replaces the settings file, so a failed save leaves the
+        previously saved settings intact.
+        """
+        tmp_file = self.settings_file.with_name(self.settings_file.name + '.tmp')
         try:
+            data = _dumps(self._settings)
             self.settings_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.settings_file, 'w') as f:
-                json.dump(self._settings, f, indent=2)
-            logger.info(f"Settings saved to {self.settings_file}")
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, self.settings_file)
+            self._loaded_mtime_ns = self.settings_file.stat().st_mtime_ns
+            logger.info("Settings saved to %s", self.settings_file)
         except Exception as e:
-            logger.error(f"Error saving settings: {e}")
+            logger.error("Error saving settings: %s", e)
+            try:
+                tmp_file.unlink(missing_ok=True)
+            except OSError:
+                pass
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -82,16 +184,19 @@ class Settings:
         Returns:
             Setting value or default
         """
-        keys = key.split('.')
-        value = self._settings
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
+        try:
+            value = self._cache[key]
+        except KeyError:
+            value = self._settings
+            for k in _split_key(key):
+                if isinstance(value, dict) and k in value:
+                    value = value[k]
+                else:
+                    value = _MISSING
+                    break
+            self._cache[key] = value
         
-        return value
+        return default if value is _MISSING else value
     
     def set(self, key: str, value: Any) -> None:
         """
@@ -101,7 +206,7 @@ class Settings:
             key: Setting key (supports dot notation, e.g., 'window.width')
             value: Value to set
         """
-        keys = key.split('.')
+        keys = _split_key(key)
         settings = self._settings
         
         for k in keys[:-1]:
@@ -110,8 +215,41 @@ class Settings:
             settings = settings[k]
         
         settings[keys[-1]] = value
+        self._cache.clear()
+        self._loaded_mtime_ns = None
+    
+    def update(self, values: Dict[str, Any]) -> bool:
+        """
+        Set several setting values at once.
+        
+        Args:
+            values: Mapping of setting keys (dot notation supported) to values
+            
+        Returns:
+            True if any value changed, False otherwise
+        """
+        missing = object()
+        changed = False
+        
+        for key, value in values.items():
+            if self.get(key, missing) != value:
+                self.set(key, value)
+                changed = True
+        
+        return changed
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get all settings at once.
+        
+        Returns:
+            The internal settings dictionary (treat as read-only)
+        """
+        return self._settings
     
     def reset(self) -> None:
         """Reset settings to defaults."""
-        self._settings = self._defaults.copy()
+        self._settings = copy.deepcopy(_DEFAULTS)
+        self._cache.clear()
+        self._loaded_mtime_ns = None
         logger.info("Settings reset to defaults")
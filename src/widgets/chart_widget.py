@@ -1,15 +1,23 @@
 """Chart widget for data visualization."""
 
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPainter
 from PyQt6.QtWidgets import QWidget, QVBoxLayout
 from PyQt6.QtCharts import QChart, QChartView, QBarSeries, QBarSet, QBarCategoryAxis, QValueAxis
 
 
+# QChart.NoAnimation has no named member in PyQt6's AnimationOption flag
+_NO_ANIMATIONS = QChart.AnimationOption(0)
+
+
 class ChartWidget(QWidget):
     """
     Chart widget for displaying various types of charts.
+    
+    Animations and antialiasing are off by default; both add repaint cost
+    and can be enabled per chart with setAnimated and setAntialiased.
     """
     
     def __init__(self, parent=None):
@@ -22,10 +30,16 @@ class ChartWidget(QWidget):
         super().__init__(parent)
         
         self.chart = QChart()
-        self.chart.setAnimationOptions(QChart.AnimationOption.SeriesAnimations)
+        self.chart.setAnimationOptions(_NO_ANIMATIONS)
+        self.chart.legend().setAlignment(Qt.AlignmentFlag.AlignBottom)
         
         self.chart_view = QChartView(self.chart)
-        self.chart_view.setRenderHint(Qt.RenderHint.Antialiasing)
+        
+        # Bar chart series and axes, created on first use and then updated
+        # in place so refreshes do not rebuild the chart
+        self._bar_series: Optional[QBarSeries] = None
+        self._axis_x: Optional[QBarCategoryAxis] = None
+        self._axis_y: Optional[QValueAxis] = None
         
         layout = QVBoxLayout()
         layout.addWidget(self.chart_view)
@@ -41,9 +55,53 @@ class ChartWidget(QWidget):
         """
         self.chart.setTitle(title)
     
+    def setAnimated(self, animated: bool) -> None:
+        """
+        Enable or disable series animations.
+        
+        Args:
+            animated: Whether series changes are animated
+        """
+        self.chart.setAnimationOptions(
+            QChart.AnimationOption.SeriesAnimations if animated
+            else _NO_ANIMATIONS
+        )
+    
+    def setAntialiased(self, antialiased: bool) -> None:
+        """
+        Enable or disable antialiased rendering.
+        
+        Args:
+            antialiased: Whether the chart is drawn antialiased
+        """
+        self.chart_view.setRenderHint(QPainter.RenderHint.Antialiasing, antialiased)
+    
     def clear(self) -> None:
         """Clear the chart."""
-        self.chart.removeAllSeries()
+        if self._bar_series is not None:
+            self._bar_series.clear()
+            self._axis_x.clear()
+    
+    def _ensure_bar_chart(self) -> QBarSeries:
+        """
+        Create the bar series and its axes on first use.
+        
+        Returns:
+            The chart's bar series
+        """
+        if self._bar_series is None:
+            self._bar_series = QBarSeries()
+            self.chart.addSeries(self._bar_series)
+            
+            self._axis_x = QBarCategoryAxis()
+            self.chart.addAxis(self._axis_x, Qt.AlignmentFlag.AlignBottom)
+            self._bar_series.attachAxis(self._axis_x)
+            
+            self._axis_y = QValueAxis()
+            self.chart.addAxis(self._axis_y, Qt.AlignmentFlag.AlignLeft)
+            self._bar_series.attachAxis(self._axis_y)
+        
+        return self._bar_series
     
     def createBarChart(
         self,
@@ -55,37 +113,41 @@ class ChartWidget(QWidget):
         """
         Create a bar chart.
         
+        Calling this again updates the existing chart. Values are replaced in
+        place when the series names and value counts are unchanged.
+        
         Args:
             categories: X-axis categories
             data: List of (series_name, values) tuples
             x_label: X-axis label
             y_label: Y-axis label
         """
-        self.clear()
+        series = self._ensure_bar_chart()
+        bar_sets = series.barSets()
         
-        series = QBarSeries()
+        if [(bar_set.label(), bar_set.count()) for bar_set in bar_sets] == [
+                (name, len(values)) for name, values in data]:
+            for bar_set, (_, values) in zip(bar_sets, data):
+                for i, value in enumerate(values):
+                    if bar_set.at(i) != value:
+                        bar_set.replace(i, value)
+        else:
+            series.clear()
+            bar_sets = []
+            for name, values in data:
+                bar_set = QBarSet(name)
+                bar_set.append(values)
+                bar_sets.append(bar_set)
+            series.append(bar_sets)
         
-        for name, values in data:
-            bar_set = QBarSet(name)
-            bar_set.append(values)
-            series.append(bar_set)
+        if self._axis_x.categories() != categories:
+            self._axis_x.setCategories(categories)
+        self._axis_x.setTitleText(x_label)
         
-        self.chart.addSeries(series)
+        # The value axis does not track data changes on a reused series
+        all_values = [value for _, values in data for value in values]
+        self._axis_y.setRange(min(all_values + [0]), max(all_values + [0]))
+        self._axis_y.setTitleText(y_label)
         
-        # X-axis
-        axis_x = QBarCategoryAxis()
-        axis_x.append(categories)
-        if x_label:
-            axis_x.setTitleText(x_label)
-        self.chart.addAxis(axis_x, Qt.AlignmentFlag.AlignBottom)
-        series.attachAxis(axis_x)
-        
-        # Y-axis
-        axis_y = QValueAxis()
-        if y_label:
-            axis_y.setTitleText(y_label)
-        self.chart.addAxis(axis_y, Qt.AlignmentFlag.AlignLeft)
-        series.attachAxis(axis_y)
-        
-        self.chart.legend().setVisible(True)
-        self.chart.legend().setAlignment(Qt.AlignmentFlag.AlignBottom)
+        # A single series needs no legend
+        self.chart.legend().setVisible(len(data) > 1)
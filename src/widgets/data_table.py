@@ -1,16 +1,46 @@
 """Data table widget with ListView wrapper."""
 
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Sequence
 
-from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QVariant
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
 from PyQt6.QtWidgets import QTableView, QHeaderView, QAbstractItemView
 
 
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_TEXT_ROLES = frozenset((Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole))
+
+# Vertical header labels ("1", "2", ...), shared by all models and grown on
+# demand up to _ROW_LABEL_CACHE_SIZE; labels past that are built per call
+_ROW_LABEL_CACHE_SIZE = 10_000
+_ROW_LABELS: List[str] = []
+
+
+def _row_label(section: int) -> str:
+    """
+    Get the vertical header label for a row.
+    
+    Args:
+        section: Row index
+        
+    Returns:
+        One-based row number as a string
+    """
+    if section >= _ROW_LABEL_CACHE_SIZE:
+        return str(section + 1)
+    if section >= len(_ROW_LABELS):
+        _ROW_LABELS.extend(map(str, range(len(_ROW_LABELS) + 1, section + 2)))
+    return _ROW_LABELS[section]
+
+
 class TableModel(QAbstractTableModel):
     """
     Table model for displaying data in a table view.
     """
     
+    # Slot storage speeds up the attribute reads done for every cell; the
+    # Qt wrapper still provides a __dict__ for subclasses' attributes
+    __slots__ = ('_data', '_headers')
+    
     def __init__(self, data: Optional[List[List[Any]]] = None, 
                  headers: Optional[List[str]] = None):
         """
@@ -22,7 +52,7 @@ class TableModel(QAbstractTableModel):
         """
         super().__init__()
         self._data = data or []
-        self._headers = headers or []
+        self._headers = tuple(headers or ())
     
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
         """Get row count."""
@@ -34,27 +64,28 @@ class TableModel(QAbstractTableModel):
     
     def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
         """Get data at index."""
-        if not index.isValid():
-            return QVariant()
+        # Views ask for every role of every visible cell; bail out before
+        # touching the index for the roles this model does not provide
+        if role not in _TEXT_ROLES or not index.isValid():
+            return None
         
-        if role == Qt.ItemDataRole.DisplayRole or role == Qt.ItemDataRole.EditRole:
-            try:
-                return self._data[index.row()][index.column()]
-            except (IndexError, KeyError):
-                return QVariant()
-        
-        return QVariant()
+        try:
+            return self._data[index.row()][index.column()]
+        except (IndexError, KeyError):
+            return None
     
     def headerData(self, section: int, orientation: Qt.Orientation, 
                    role: int = Qt.ItemDataRole.DisplayRole) -> Any:
         """Get header data."""
-        if role == Qt.ItemDataRole.DisplayRole:
-            if orientation == Qt.Orientation.Horizontal and section < len(self._headers):
-                return self._headers[section]
-            elif orientation == Qt.Orientation.Vertical:
-                return str(section + 1)
+        if role != _DISPLAY_ROLE:
+            return None
+        
+        if orientation == Qt.Orientation.Horizontal and section < len(self._headers):
+            return self._headers[section]
+        elif orientation == Qt.Orientation.Vertical:
+            return _row_label(section)
         
-        return QVariant()
+        return None
     
     def setData(self, data: List[List[Any]], headers: Optional[List[str]] = None) -> None:
         """
@@ -67,7 +98,7 @@ class TableModel(QAbstractTableModel):
         self.beginResetModel()
         self._data = data
         if headers:
-            self._headers = headers
+            self._headers = tuple(headers)
         self.endResetModel()
     
     def appendRow(self, row: List[Any]) -> None:
@@ -81,6 +112,40 @@ class TableModel(QAbstractTableModel):
         self._data.append(row)
         self.endInsertRows()
     
+    def appendRows(self, rows: List[List[Any]]) -> None:
+        """
+        Append several rows to the table in one insertion.
+        
+        Views are notified once for the whole batch instead of once per row.
+        
+        Args:
+            rows: Rows to append
+        """
+        if not rows:
+            return
+        first = len(self._data)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._data.extend(rows)
+        self.endInsertRows()
+    
+    def rowValues(self, row: int) -> Sequence[Any]:
+        """
+        Get the values of a row.
+        
+        Args:
+            row: Row index
+            
+        Returns:
+            The row's values (not a copy; treat as read-only), or an empty
+            sequence if the row does not exist
+        """
+        if row < 0:
+            return ()
+        try:
+            return self._data[row]
+        except IndexError:
+            return ()
+    
     def clear(self) -> None:
         """Clear all data from the table."""
         self.beginResetModel()
@@ -93,16 +158,21 @@ class DataTable(QTableView):
     Enhanced table view widget with common functionality.
     """
     
-    def __init__(self, parent=None):
+    # Rows measured when sizing columns to their contents
+    RESIZE_SAMPLE_ROWS = 100
+    
+    def __init__(self, parent=None, model: Optional[TableModel] = None):
         """
         Initialize the data table widget.
         
         Args:
             parent: Parent widget
+            model: Optional table model to use (defaults to a new TableModel)
         """
         super().__init__(parent)
         
-        self._model = TableModel()
+        self._model = model if model is not None else TableModel()
+        self._proxy: Optional[QSortFilterProxyModel] = None
         self.setModel(self._model)
         
         # Configure table
@@ -116,11 +186,24 @@ class DataTable(QTableView):
         if horizontal_header:
             horizontal_header.setStretchLastSection(True)
             horizontal_header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+            # Measure a sample of rows, not every cell, when fitting columns
+            horizontal_header.setResizeContentsPrecision(self.RESIZE_SAMPLE_ROWS)
         
         vertical_header = self.verticalHeader()
         if vertical_header:
             vertical_header.setVisible(False)
     
+    def setProxyModel(self, proxy: QSortFilterProxyModel) -> None:
+        """
+        Show the table's data through a proxy model.
+        
+        Args:
+            proxy: Proxy model; its source is set to the table's model
+        """
+        self._proxy = proxy
+        proxy.setSourceModel(self._model)
+        self.setModel(proxy)
+    
     def setData(self, data: List[List[Any]], headers: Optional[List[str]] = None) -> None:
         """
         Set table data.
@@ -141,6 +224,15 @@ class DataTable(QTableView):
         """
         self._model.appendRow(row)
     
+    def appendRows(self, rows: List[List[Any]]) -> None:
+        """
+        Append several rows to the table.
+        
+        Args:
+            rows: Rows to append
+        """
+        self._model.appendRows(rows)
+    
     def clear(self) -> None:
         """Clear all data from the table."""
         self._model.clear()
@@ -150,12 +242,17 @@ class DataTable(QTableView):
         Get the currently selected row index.
         
         Returns:
-            Selected row index or None
+            Selected row index in the table's model, or None
         """
         indexes = self.selectedIndexes()
-        return indexes[0].row() if indexes else None
+        if not indexes:
+            return None
+        index = indexes[0]
+        if self._proxy is not None:
+            index = self._proxy.mapToSource(index)
+        return index.row()
     
-    def getRowData(self, row: int) -> List[Any]:
+    def getRowData(self, row: int) -> Sequence[Any]:
         """
         Get data for a specific row.
         
@@ -163,6 +260,6 @@ class DataTable(QTableView):
             row: Row index
             
         Returns:
-            List of values for the row
+            Values for the row, or an empty sequence if the row does not exist
         """
-        return self._model._data[row] if 0 <= row < len(self._model._data) else []
+        return self._model.rowValues(row)
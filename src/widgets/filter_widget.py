@@ -1,14 +1,149 @@
 """Filter widget for data filtering."""
 
-from typing import Callable, Optional
+from typing import Callable, Dict, List, Optional
 
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import Qt, QModelIndex, QSortFilterProxyModel, QTimer, pyqtSignal
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
     QLineEdit, QComboBox, QPushButton, QGroupBox
 )
 
 
+class FilterProxyModel(QSortFilterProxyModel):
+    """
+    Proxy model applying FilterWidget filters to a source table model.
+    
+    Matching is case-insensitive. A field of "*" matches against every column.
+    
+    The source's cell text is read and lower-cased once per source change,
+    and each filter is evaluated in a single pass over it into a row mask,
+    so typing a filter does not go back to the source model for every cell.
+    """
+    
+    # Operator names as offered by FilterWidget, mapped to (cell, value) predicates
+    OPERATORS: Dict[str, Callable[[str, str], bool]] = {
+        "Contains": lambda cell, value: value in cell,
+        "Equals": lambda cell, value: cell == value,
+        "Starts with": str.startswith,
+        "Ends with": str.endswith,
+    }
+    
+    def __init__(self, parent=None):
+        """
+        Initialize the filter proxy model.
+        
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._columns: List[int] = []
+        self._predicate: Optional[Callable[[str, str], bool]] = None
+        self._value = ""
+        self._texts: Optional[List[List[str]]] = None  # Lower-cased cells by row
+        self._mask: Optional[List[bool]] = None  # Accepted flag by source row
+    
+    def setSourceModel(self, source) -> None:
+        """
+        Set the source model, tracking its changes to drop cached text.
+        
+        Args:
+            source: Source model
+        """
+        # Connected before the base class connects its own handlers, so the
+        # cache is dropped before changed rows are filtered again
+        old = self.sourceModel()
+        if old is not None:
+            for signal in self._source_signals(old):
+                signal.disconnect(self._on_source_changed)
+        if source is not None:
+            for signal in self._source_signals(source):
+                signal.connect(self._on_source_changed)
+        
+        self._texts = None
+        self._mask = None
+        super().setSourceModel(source)
+    
+    @staticmethod
+    def _source_signals(source) -> tuple:
+        """Get the source model signals that change cell text."""
+        return (source.modelReset, source.layoutChanged, source.dataChanged,
+                source.rowsInserted, source.rowsRemoved, source.rowsMoved,
+                source.columnsInserted, source.columnsRemoved)
+    
+    def _on_source_changed(self, *args) -> None:
+        """Drop cached text after the source model changed."""
+        self._texts = None
+        self._mask = None
+    
+    def set_filter(self, field: str, operator: str, value: str) -> None:
+        """
+        Set the active filter.
+        
+        An empty field or value clears the filter.
+        
+        Args:
+            field: Column header to filter on, or "*" for all columns
+            operator: Operator name (see OPERATORS)
+            value: Value to compare against
+        """
+        source = self.sourceModel()
+        
+        if not field or not value or source is None:
+            self._predicate = None
+            self._columns = []
+        else:
+            column_count = source.columnCount()
+            if field == "*":
+                self._columns = list(range(column_count))
+            else:
+                self._columns = [
+                    column for column in range(column_count)
+                    if source.headerData(column, Qt.Orientation.Horizontal) == field
+                ]
+            self._predicate = self.OPERATORS.get(operator, self.OPERATORS["Contains"])
+            self._value = value.lower()
+        
+        self._mask = None
+        self.invalidateRowsFilter()
+    
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        """Check whether a source row passes the active filter."""
+        if self._predicate is None:
+            return True
+        
+        if self._mask is None:
+            self._mask = self._build_mask()
+        return self._mask[source_row]
+    
+    def _build_mask(self) -> List[bool]:
+        """
+        Evaluate the active filter for every source row.
+        
+        Returns:
+            Whether each source row passes the filter
+        """
+        if self._texts is None:
+            source = self.sourceModel()
+            column_count = source.columnCount()
+            self._texts = [
+                [
+                    "" if cell is None else str(cell).lower()
+                    for cell in (source.index(row, column).data()
+                                 for column in range(column_count))
+                ]
+                for row in range(source.rowCount())
+            ]
+        
+        predicate = self._predicate
+        value = self._value
+        columns = self._columns
+        # Empty cells never match: the filter value is never empty
+        return [
+            any(predicate(texts[column], value) for column in columns)
+            for texts in self._texts
+        ]
+
+
 class FilterWidget(QWidget):
     """
     Filter widget for filtering table data.
@@ -16,6 +151,9 @@ class FilterWidget(QWidget):
     
     filterChanged = pyqtSignal(str, str, str)  # field, operator, value
     
+    # Quiet period after the last quick search keystroke before filtering
+    SEARCH_DELAY_MS = 150
+    
     def __init__(self, parent=None):
         """
         Initialize the filter widget.
@@ -25,6 +163,11 @@ class FilterWidget(QWidget):
         """
         super().__init__(parent)
         
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DELAY_MS)
+        self._search_timer.timeout.connect(self._emit_search)
+        
         self._setup_ui()
     
     def _setup_ui(self) -> None:
@@ -92,16 +235,23 @@ class FilterWidget(QWidget):
         operator = self.operator_combo.currentText()
         value = self.value_input.text()
         
+        self._search_timer.stop()
         self.filterChanged.emit(field, operator, value)
     
     def _on_clear_clicked(self) -> None:
         """Handle clear button click."""
         self.value_input.clear()
         self.search_input.clear()
+        self._search_timer.stop()
         self.filterChanged.emit("", "", "")
     
     def _on_search_changed(self, text: str) -> None:
-        """Handle search text change."""
+        """Handle search text change, restarting the typing delay."""
+        self._search_timer.start()
+    
+    def _emit_search(self) -> None:
+        """Emit the quick search filter once typing pauses."""
+        text = self.search_input.text()
         if not text:
             self.filterChanged.emit("", "", "")
         else:
@@ -1,10 +1,32 @@
 """Text area widget with enhanced features."""
 
+from typing import Iterable, Optional
+
 from PyQt6.QtWidgets import QPlainTextEdit, QWidget, QVBoxLayout
-from PyQt6.QtGui import QFont
+from PyQt6.QtGui import QFont, QFontDatabase, QTextCursor
 from PyQt6.QtCore import Qt
 
 
+_READ_ONLY_QSS = "QPlainTextEdit { background-color: #f5f5f5; }"
+
+# Shared monospace font; created on first use since it needs a QApplication
+_mono_font: Optional[QFont] = None
+
+
+def _get_mono_font() -> QFont:
+    """
+    Get the monospace font used by text areas.
+    
+    Returns:
+        The system fixed-pitch font at 10pt
+    """
+    global _mono_font
+    if _mono_font is None:
+        _mono_font = QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont)
+        _mono_font.setPointSize(10)
+    return _mono_font
+
+
 class TextArea(QPlainTextEdit):
     """
     Enhanced text area widget with additional features.
@@ -20,8 +42,7 @@ class TextArea(QPlainTextEdit):
         super().__init__(parent)
         
         # Set monospace font
-        font = QFont("Courier New", 10)
-        self.setFont(font)
+        self.setFont(_get_mono_font())
         
         # Enable line wrap
         self.setLineWrapMode(QPlainTextEdit.LineWrapMode.WidgetWidth)
@@ -53,6 +74,26 @@ class TextArea(QPlainTextEdit):
         """
         self.appendPlainText(text)
     
+    def appendLines(self, lines: Iterable[str]) -> None:
+        """
+        Append several lines in a single insertion.
+        
+        The document is laid out once for the whole batch rather than once
+        per line, as repeated appendText calls would.
+        
+        Args:
+            lines: Lines to append
+        """
+        text = "\n".join(lines)
+        if not text:
+            return
+        
+        cursor = QTextCursor(self.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        if not self.document().isEmpty():
+            text = "\n" + text
+        cursor.insertText(text)
+    
     def clearText(self) -> None:
         """Clear all text content."""
         self.clear()
@@ -66,6 +107,6 @@ class TextArea(QPlainTextEdit):
         """
         super().setReadOnly(read_only)
         if read_only:
-            self.setStyleSheet("QPlainTextEdit { background-color: #f5f5f5; }")
+            self.setStyleSheet(_READ_ONLY_QSS)
         else:
             self.setStyleSheet("")
@@ -0,0 +1,26 @@
+"""Shared test fixtures."""
+
+import os
+
+import pytest
+
+try:
+    from PyQt6.QtWidgets import QApplication
+except ImportError:  # Qt tests skip themselves; the rest of the suite still runs
+    QApplication = None
+
+
+@pytest.fixture(scope="session", autouse=True)
+def qapp():
+    """Create the QApplication instance shared by all tests."""
+    if QApplication is None:
+        yield None
+        return
+    
+    app = QApplication.instance()
+    if app is None:
+        # Headless by default: no windowing system plugin or display needed.
+        # An explicitly set QT_QPA_PLATFORM still wins.
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        app = QApplication([])
+    yield app
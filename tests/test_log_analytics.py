@@ -0,0 +1,199 @@
+"""Tests for log analytics."""
+
+import pytest
+from pathlib import Path
+import re
+import tempfile
+
+pytest.importorskip("PyQt6.QtCore")
+
+from src.screens.log_analytics_screen import LogAnalyzerThread, _PRESET_PATTERNS, _search_regex, re2
+
+
+@pytest.fixture
+def log_file():
+    """Create a temporary log file."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "app.log"
+        path.write_text(
+            "2024-01-01 10:00:00 INFO Started\n"
+            "2024-01-01 10:00:01 ERROR Connection failed\n"
+            + "x" * 3_000_000 + " error in a very long line\n"
+            "2024-01-01 10:00:02 WARNING Retrying\n"
+            "last line without newline Error",
+            encoding="utf-8"
+        )
+        yield path
+
+
+class TestLogAnalyzer:
+    """Tests for log analyzer thread."""
+    
+    def test_substring_search(self, log_file):
+        """Test case-insensitive substring search."""
+        analyzer = LogAnalyzerThread(str(log_file), "error", False, False)
+        results, count = analyzer._analyze_file(str(log_file))
+        
+        assert count == 3
+        assert [line_number for line_number, _ in results] == [2, 3, 5]
+        assert results[-1] == (5, "last line without newline Error")
+    
+    def test_regex_search(self, log_file):
+        """Test regex search."""
+        analyzer = LogAnalyzerThread(str(log_file), r"\bWARNING\b", True, False)
+        results, _ = analyzer._analyze_file(str(log_file))
+        
+        assert results == [(4, "2024-01-01 10:00:02 WARNING Retrying")]
+    
+    def test_search_across_scan_windows(self, log_file):
+        """Test results do not depend on the scan window size."""
+        analyzer = LogAnalyzerThread(str(log_file), r"^\d{4}|error", True, False)
+        expected = analyzer._analyze_file(str(log_file))
+        
+        analyzer.SCAN_WINDOW_SIZE = 16
+        assert analyzer._analyze_file(str(log_file)) == expected
+        assert [line_number for line_number, _ in expected[0]] == [1, 2, 3, 4]
+    
+    @pytest.mark.parametrize("window_size", [16 * 1024 * 1024, 4, 1])
+    @pytest.mark.parametrize("content, pattern, expected", [
+        ("aaa\n\nbbb\nccc\n", r"^$", [2]),
+        ("a\n\nb\n", r"^\s*$", [2]),
+        ("aaa\n\n", r"^$", [2]),
+        ("aaa\nbbb", r"$", [1, 2]),
+    ])
+    def test_empty_matches_across_windows(self, window_size, content, pattern, expected):
+        """Test empty matches report each line once and no line past the end."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "blank.log"
+            path.write_text(content, encoding="utf-8")
+            
+            analyzer = LogAnalyzerThread(str(path), pattern, True, False)
+            analyzer.SCAN_WINDOW_SIZE = window_size
+            results, count = analyzer._analyze_file(str(path))
+            
+            assert [line_number for line_number, _ in results] == expected
+            assert count == len(expected)
+    
+    def test_crlf_and_empty_files(self):
+        """Test CRLF line endings are stripped and empty files are skipped."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "windows.log"
+            path.write_bytes(b"first\r\nsecond ERROR\r\n")
+            empty = Path(tmpdir) / "empty.log"
+            empty.write_bytes(b"")
+            
+            analyzer = LogAnalyzerThread(str(path), "error", False, False)
+            
+            assert analyzer._analyze_file(str(path)) == ([(2, "second ERROR")], 1)
+            assert analyzer._analyze_file(str(empty)) == ([], 0)
+    
+    def test_search_engines(self, log_file):
+        """Test regexes use the re module and caseless ASCII text uses RE2 if installed."""
+        analyzer = LogAnalyzerThread(str(log_file), r"(?<=WARN)ING", True, False)
+        results, _ = analyzer._analyze_file(str(log_file))
+        
+        assert results == [(4, "2024-01-01 10:00:02 WARNING Retrying")]
+        assert isinstance(_search_regex(r"\d+", True), re.Pattern)
+        assert isinstance(_search_regex("error", False), re.Pattern)
+        assert isinstance(_search_regex("10:00", False), re.Pattern) == (re2 is None)
+    
+    @pytest.mark.parametrize("pattern", ["error", " 404 "])
+    def test_directory_search(self, pattern):
+        """Test directory searches keep results in file order."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name in ("a.log", "b.log", "c.txt", "d.csv"):
+                (Path(tmpdir) / name).write_text(f"{name} 404 ERROR\n", encoding="utf-8")
+            
+            analyzer = LogAnalyzerThread(tmpdir, pattern, False, True)
+            log_files = analyzer._list_log_files()
+            batches = []
+            analyzer.partial.connect(lambda lines, total: batches.append((lines, total)))
+            
+            assert [Path(log_file).name for log_file in log_files] == ["a.log", "b.log", "c.txt"]
+            assert analyzer._analyze_files(log_files) == 3
+            assert batches == [
+                ([(1, "a.log 404 ERROR")], 1),
+                ([(1, "b.log 404 ERROR")], 2),
+                ([(1, "c.txt 404 ERROR")], 3),
+            ]
+    
+    @pytest.mark.parametrize("is_directory", [False, True])
+    def test_invalid_regex(self, log_file, is_directory):
+        """Test an invalid regex finishes the analysis with an error message."""
+        path = log_file.parent if is_directory else log_file
+        analyzer = LogAnalyzerThread(str(path), "(", True, is_directory)
+        events = []
+        analyzer.progress.connect(lambda message: events.append(("progress", message)))
+        analyzer.partial.connect(lambda lines, total: events.append(("partial", total)))
+        analyzer.finished.connect(lambda total: events.append(("finished", total)))
+        analyzer.run()
+        
+        assert events[0] == ("finished", 0)
+        assert events[1][1].startswith("Invalid pattern: missing )")
+        assert len(events) == 2
+    
+    def test_result_limit(self):
+        """Test only MAX_RESULTS lines are kept while all matches are counted."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "many.log"
+            path.write_text("ERROR\n" * 25, encoding="utf-8")
+            
+            analyzer = LogAnalyzerThread(str(path), "error", False, False)
+            analyzer.MAX_RESULTS = 10
+            analyzer.BATCH_SIZE = 4
+            batches = []
+            analyzer.partial.connect(lambda lines, total: batches.append((len(lines), total)))
+            analyzer.run()
+            
+            assert batches == [(4, 4), (4, 8), (2, 12), (0, 16), (0, 20), (0, 24), (0, 25)]
+    
+    def test_caseless_text_search(self, log_file):
+        """Test plain-text searches without cased letters."""
+        analyzer = LogAnalyzerThread(str(log_file), "10:00:01", False, False)
+        results, _ = analyzer._analyze_file(str(log_file))
+        
+        assert results == [(2, "2024-01-01 10:00:01 ERROR Connection failed")]
+    
+    @pytest.mark.parametrize("pattern, is_regex, expected", [
+        ("ÉRROR", False, [1, 2]),
+        (r"caf.s", True, [3]),
+        (r"[ä]", True, []),
+        (r"\bét\w\b", True, [4]),
+    ])
+    def test_unicode_search(self, pattern, is_regex, expected):
+        """Test case folding, character classes and word boundaries follow Unicode."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "unicode.log"
+            path.write_text("érror\nÉrror\ncafés\nun été\nÉté\n", encoding="utf-8")
+            
+            analyzer = LogAnalyzerThread(str(path), pattern, is_regex, False)
+            results, _ = analyzer._analyze_file(str(path))
+            
+            assert [line_number for line_number, _ in results] == expected
+    
+    @pytest.mark.parametrize("preset", ["HTTP Requests", "Timestamps"])
+    def test_matches_confined_to_lines(self, preset):
+        """Test matches spanning a line break are not reported."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "split.log"
+            path.write_text(
+                "2024-01-01\n10:00:00 GET\n/index.html\n2024-01-01 10:00:01 POST /login\n",
+                encoding="utf-8"
+            )
+            
+            analyzer = LogAnalyzerThread(str(path), *_PRESET_PATTERNS[preset], False)
+            results, _ = analyzer._analyze_file(str(path))
+            
+            assert [line_number for line_number, _ in results] == [4]
+    
+    def test_stop(self, log_file):
+        """Test a stopped analyzer scans nothing further."""
+        analyzer = LogAnalyzerThread(str(log_file), "error", False, False)
+        analyzer.stop()
+        
+        assert analyzer._analyze_file(str(log_file)) == ([], 0)
+        
+        analyzer = LogAnalyzerThread(str(log_file.parent), "error", False, True)
+        analyzer.stop()
+        
+        assert analyzer._list_log_files() == []
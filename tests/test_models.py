@@ -60,6 +60,71 @@ class TestJobModel:
         
         assert job.has_errors
     
+    def test_job_completed_batches(self):
+        """Test completed batch counting."""
+        job = ConversionJob(
+            job_id="TEST001",
+            name="Test Job",
+            status=JobStatus.RUNNING,
+            created_at=datetime.now(),
+            batches=[
+                BatchInfo("BATCH1", 10, 10, 0, datetime(2024, 1, 1), datetime(2024, 1, 1)),
+                BatchInfo("BATCH2", 10, 5, 0, datetime(2024, 1, 1)),
+            ]
+        )
+        
+        assert job.total_batches == 2
+        assert job.completed_batches == 1
+        
+        job.on_batch_finished(job.batches[1])
+        assert job.completed_batches == 2
+        assert job.batches[1].end_time is not None
+        
+        job.on_batch_finished(job.batches[1])
+        assert job.completed_batches == 2
+        
+        job.add_batch(BatchInfo("BATCH3", 10, 0, 0))
+        assert job.total_batches == 3
+        assert job.completed_batches == 2
+    
+    def test_models_use_slots(self):
+        """Test model instances do not carry a __dict__."""
+        job = ConversionJob(
+            job_id="TEST001",
+            name="Test Job",
+            status=JobStatus.PENDING,
+            created_at=datetime.now()
+        )
+        error = JobError(timestamp=datetime.now(), message="Test error")
+        batch = BatchInfo("BATCH1", 10, 0, 0)
+        
+        for obj in (job, error, batch):
+            assert not hasattr(obj, "__dict__")
+    
+    def test_job_identity(self):
+        """Test jobs compare and hash by job ID, batches by identity."""
+        job1 = ConversionJob(
+            job_id="TEST001",
+            name="Test Job",
+            status=JobStatus.PENDING,
+            created_at=datetime.now()
+        )
+        job2 = ConversionJob(
+            job_id="TEST001",
+            name="Renamed Job",
+            status=JobStatus.RUNNING,
+            created_at=datetime.now()
+        )
+        
+        assert job1 == job2
+        assert len({job1, job2}) == 1
+        
+        # Batch IDs repeat across jobs, so batches only equal themselves
+        batch = BatchInfo("BATCH1", 10, 0, 0)
+        assert batch == batch
+        assert batch != BatchInfo("BATCH1", 10, 0, 0)
+        assert len({batch, BatchInfo("BATCH1", 10, 0, 0)}) == 2
+    
     def test_batch_progress(self):
         """Test batch progress calculation."""
         batch = BatchInfo(
@@ -70,6 +135,9 @@ class TestJobModel:
         )
         
         assert batch.progress_percentage == 50.0
+        
+        batch.update_progress(75, 5)
+        assert batch.progress_percentage == 75.0
 
 
 class TestPaymentModel:
@@ -79,7 +147,7 @@ class TestPaymentModel:
         """Test creating a payment."""
         payment = Payment(
             payment_id="PAY001",
-            amount=Decimal("100.50"),
+            amount_cents=10050,
             currency="USD",
             status=PaymentStatus.PENDING,
             method=PaymentMethod.CREDIT_CARD,
@@ -95,7 +163,7 @@ class TestPaymentModel:
         """Test payment status check methods."""
         payment = Payment(
             payment_id="PAY001",
-            amount=Decimal("100.00"),
+            amount_cents=10000,
             currency="USD",
             status=PaymentStatus.COMPLETED,
             method=PaymentMethod.CREDIT_CARD,
@@ -109,7 +177,7 @@ class TestPaymentModel:
         """Test formatted amount display."""
         payment = Payment(
             payment_id="PAY001",
-            amount=Decimal("1234.56"),
+            amount_cents=123456,
             currency="USD",
             status=PaymentStatus.COMPLETED,
             method=PaymentMethod.CREDIT_CARD,
@@ -117,3 +185,10 @@ class TestPaymentModel:
         )
         
         assert payment.formatted_amount == "USD 1234.56"
+        
+        payment.set_amount(1000, "EUR")
+        assert payment.formatted_amount == "EUR 10.00"
+        
+        payment.set_amount(-5)
+        assert payment.formatted_amount == "EUR -0.05"
+        assert payment.amount == Decimal("-0.05")
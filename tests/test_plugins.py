@@ -1,6 +1,8 @@
 """Tests for plugin system."""
 
+import importlib.util
 import pytest
+import sys
 from pathlib import Path
 import tempfile
 
@@ -96,6 +98,133 @@ class TestPlugin(PluginInterface):
             
             assert "test_plugin" in plugins
     
+    def test_discover_plugins_cache_invalidation(self):
+        """Test discovery cache picks up new plugin files."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = PluginManager(tmpdir)
+            assert manager.discover_plugins() == []
+            
+            (Path(tmpdir) / "new_plugin.py").write_text("")
+            (Path(tmpdir) / "_private.py").write_text("")
+            (Path(tmpdir) / "notes.txt").write_text("")
+            
+            assert manager.discover_plugins() == ["new_plugin"]
+    
+    def test_load_plugin_with_plugin_class(self):
+        """Test loading a plugin that declares PLUGIN_CLASS."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plugin_file = Path(tmpdir) / "declared_plugin.py"
+            plugin_file.write_text("""
+from src.plugins.plugin_interface import PluginInterface
+
+class BasePlugin(PluginInterface):
+    @property
+    def name(self):
+        return "Base"
+    
+    @property
+    def version(self):
+        return "1.0"
+    
+    @property
+    def description(self):
+        return "Base"
+    
+    def initialize(self, app_context):
+        pass
+    
+    def cleanup(self):
+        pass
+
+class DeclaredPlugin(BasePlugin):
+    @property
+    def name(self):
+        return "Declared"
+
+PLUGIN_CLASS = DeclaredPlugin
+""")
+            
+            manager = PluginManager(tmpdir)
+            
+            assert manager.load_plugin("declared_plugin")
+            assert manager.get_plugin("declared_plugin").name == "Declared"
+    
+    def test_load_plugin_skips_imported_classes(self):
+        """Test fallback lookup ignores plugin classes imported from elsewhere."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plugin_file = Path(tmpdir) / "importing_plugin.py"
+            plugin_file.write_text("""
+from tests.test_plugins import TestPlugin
+""")
+            
+            manager = PluginManager(tmpdir)
+            
+            assert not manager.load_plugin("importing_plugin")
+    
+    def test_load_plugin_namespaced_module(self):
+        """Test plugin modules are registered under a namespaced key."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plugin_file = Path(tmpdir) / "reloadable.py"
+            plugin_file.write_text("""
+from tests.test_plugins import TestPlugin
+
+class ReloadablePlugin(TestPlugin):
+    VERSION = 1
+
+PLUGIN_CLASS = ReloadablePlugin
+""")
+            
+            manager = PluginManager(tmpdir)
+            
+            assert manager.load_plugin("reloadable")
+            assert "reloadable" not in sys.modules
+            assert "conversion_gui_plugin.reloadable" in sys.modules
+            
+            plugin_file.write_text(plugin_file.read_text().replace("VERSION = 1", "VERSION = 20"))
+            assert manager.reload_plugin("reloadable")
+            assert manager.get_plugin("reloadable").VERSION == 20
+            
+            assert manager.unload_plugin("reloadable")
+            assert "conversion_gui_plugin.reloadable" not in sys.modules
+    
+    @pytest.mark.parametrize("dont_write_bytecode", [False, True])
+    def test_load_plugin_writes_bytecode(self, monkeypatch, dont_write_bytecode):
+        """Test loading a plugin caches its bytecode unless disabled."""
+        monkeypatch.setattr(sys, "dont_write_bytecode", dont_write_bytecode)
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plugin_file = Path(tmpdir) / "compiled_plugin.py"
+            plugin_file.write_text("""
+from tests.test_plugins import TestPlugin
+
+PLUGIN_CLASS = TestPlugin
+""")
+            
+            manager = PluginManager(tmpdir)
+            
+            assert manager.load_plugin("compiled_plugin")
+            cfile = Path(importlib.util.cache_from_source(str(plugin_file)))
+            assert cfile.exists() != dont_write_bytecode
+    
+    def test_load_plugin_unwritable_bytecode_cache(self, monkeypatch):
+        """Test a plugin still loads when its bytecode cannot be written."""
+        monkeypatch.setattr(sys, "dont_write_bytecode", False)
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / "__pycache__").write_text("not a directory")
+            (Path(tmpdir) / "uncached_plugin.py").write_text("""
+from tests.test_plugins import TestPlugin
+
+PLUGIN_CLASS = TestPlugin
+""")
+            
+            manager = PluginManager(tmpdir)
+            
+            assert manager.load_plugin("uncached_plugin")
+            assert manager.get_plugin("uncached_plugin") is not None
+            assert PluginManager._module_name("uncached_plugin") in sys.modules
+            assert manager.unload_plugin("uncached_plugin")
+    
     def test_get_all_plugins(self):
         """Test getting all plugins."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -111,3 +240,18 @@ class TestPlugin(PluginInterface):
             
             plugins = manager.get_enabled_plugins()
             assert isinstance(plugins, list)
+    
+    def test_enable_disable_plugin(self):
+        """Test enabled plugin bookkeeping."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = PluginManager(tmpdir)
+            plugin = TestPlugin()
+            manager._plugins["test"] = plugin
+            
+            assert manager.enable_plugin("test", None)
+            assert manager.enable_plugin("test", None)
+            assert manager.get_enabled_plugins() == [plugin]
+            
+            assert manager.disable_plugin("test")
+            assert manager.get_enabled_plugins() == []
+            assert not manager.disable_plugin("test")
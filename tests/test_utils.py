@@ -5,8 +5,9 @@ import logging
 from pathlib import Path
 import tempfile
 import json
+import os
 
-from src.utils.logger import setup_logger, get_logger
+from src.utils.logger import setup_logger, get_logger, stop_background_logging
 from src.utils.settings import Settings
 
 
@@ -33,6 +34,17 @@ class TestLogger:
             content = log_file.read_text()
             assert "Test message" in content
     
+    def test_setup_logger_background(self):
+        """Test logger setup with a background file writer."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = Path(tmpdir) / "test.log"
+            logger = setup_logger("test_logger_background", str(log_file), background=True)
+            
+            logger.info("Background message")
+            stop_background_logging()
+            
+            assert "Background message" in log_file.read_text()
+    
     def test_get_logger(self):
         """Test getting existing logger."""
         logger1 = setup_logger("test_logger_get")
@@ -80,6 +92,44 @@ class TestSettings:
             settings2 = Settings(str(settings_file))
             assert settings2.get("custom_key") == "custom_value"
     
+    def test_settings_save_non_str_keys(self):
+        """Test non-string dict keys are saved as strings."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            settings_file = Path(tmpdir) / "settings.json"
+            
+            settings = Settings(str(settings_file))
+            settings.set("column_widths", {1: 120, 2: 80})
+            settings.save()
+            
+            assert Settings(str(settings_file)).get("column_widths") == {"1": 120, "2": 80}
+    
+    def test_settings_failed_save_keeps_file(self):
+        """Test a save that cannot serialize the settings keeps the saved file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            settings_file = Path(tmpdir) / "settings.json"
+            
+            settings = Settings(str(settings_file))
+            settings.set("theme", "dark")
+            settings.save()
+            saved = settings_file.read_bytes()
+            
+            settings.set("theme", object())
+            settings.save()
+            
+            assert settings_file.read_bytes() == saved
+            assert os.listdir(tmpdir) == ["settings.json"]
+    
+    def test_settings_load_large_file(self):
+        """Test loading a settings file above the memory-map threshold."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            settings_file = Path(tmpdir) / "settings.json"
+            recent = [f"/data/file_{i}.csv" for i in range(10000)]
+            settings_file.write_text(json.dumps({"theme": "dark", "recent_files": recent}))
+            
+            settings = Settings(str(settings_file))
+            assert settings.get("theme") == "dark"
+            assert settings.get("recent_files") == recent
+    
     def test_settings_reset(self):
         """Test resetting settings to defaults."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -89,9 +139,15 @@ class TestSettings:
             settings.set("custom_key", "custom_value")
             assert settings.get("custom_key") == "custom_value"
             
+            settings.set("window.width", 800)
+            settings.get("recent_files").append("data.csv")
+            
             settings.reset()
             assert settings.get("custom_key") is None
             assert settings.get("theme") == "light"
+            assert settings.get("window.width") == 1280
+            assert settings.get("recent_files") == []
+            assert Settings(str(settings_file)).get("window.width") == 1280
     
     def test_settings_get_with_default(self):
         """Test getting value with default."""
@@ -101,3 +157,46 @@ class TestSettings:
             
             value = settings.get("nonexistent", "default_value")
             assert value == "default_value"
+    
+    def test_settings_update(self):
+        """Test setting several values at once."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            settings_file = Path(tmpdir) / "settings.json"
+            settings = Settings(str(settings_file))
+            
+            assert not settings.update({"window.width": 1280, "theme": "light"})
+            assert settings.update({"window.width": 800, "new.key": None})
+            assert settings.get("window.width") == 800
+            assert settings.get("new.key", "missing") is None
+    
+    def test_settings_cache_invalidation(self):
+        """Test cached lookups follow set, load, and reset."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            settings_file = Path(tmpdir) / "settings.json"
+            settings = Settings(str(settings_file))
+            
+            assert settings.get("window.width") == 1280
+            assert settings.get("plugin.name") is None
+            settings.set("plugin", {"name": "csv"})
+            assert settings.get("plugin.name") == "csv"
+            
+            settings.save()
+            settings.set("plugin.name", "xml")
+            settings.load()
+            assert settings.get("plugin.name") == "csv"
+            
+            settings_file.write_text(json.dumps({"theme": "dark"}))
+            os.utime(settings_file, ns=(0, 0))
+            settings.load()
+            assert settings.get("theme") == "dark"
+            assert settings.get("plugin.name") is None
+    
+    def test_settings_snapshot(self):
+        """Test getting all settings at once."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            settings_file = Path(tmpdir) / "settings.json"
+            settings = Settings(str(settings_file))
+            
+            snap = settings.snapshot()
+            assert snap["theme"] == "light"
+            assert snap["window"]["width"] == 1280
@@ -1,151 +1,327 @@
 """Tests for widgets."""
 
 import pytest
-from PyQt6.QtWidgets import QApplication
 
+Qt = pytest.importorskip("PyQt6.QtCore").Qt
+
+from src.widgets import data_table as data_table_module
 from src.widgets.data_table import DataTable, TableModel
+from src.widgets.filter_widget import FilterProxyModel, FilterWidget
 from src.widgets.text_area import TextArea
 
 
 @pytest.fixture(scope="session")
-def qapp():
-    """Create QApplication instance for tests."""
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    yield app
+def shared_data_table():
+    """Create one data table for the whole test session."""
+    return DataTable()
+
+
+@pytest.fixture
+def data_table(shared_data_table):
+    """Provide the shared data table, emptied for each test."""
+    shared_data_table.clear()
+    return shared_data_table
+
+
+@pytest.fixture(scope="session")
+def shared_text_area():
+    """Create one text area for the whole test session."""
+    return TextArea()
+
+
+@pytest.fixture
+def text_area(shared_text_area):
+    """Provide the shared text area, reset after each test."""
+    yield shared_text_area
+    shared_text_area.setText("")
+    shared_text_area.setReadOnly(False)
+
+
+@pytest.fixture
+def sample_model():
+    """Create a table model holding one row."""
+    return TableModel([["1", "John", "john@example.com"]], ["ID", "Name", "Email"])
 
 
 class TestTableModel:
     """Tests for table model."""
     
-    def test_model_creation(self):
-        """Test creating a table model."""
-        data = [["1", "John", "john@example.com"]]
-        headers = ["ID", "Name", "Email"]
-        
-        model = TableModel(data, headers)
-        
-        assert model.rowCount() == 1
-        assert model.columnCount() == 3
+    @pytest.mark.parametrize("operation, expected_rows", [
+        (lambda model: None, 1),
+        (lambda model: model.appendRow(["2", "Jane", "jane@example.com"]), 2),
+        (lambda model: model.clear(), 0),
+    ], ids=["created", "append_row", "clear"])
+    def test_model_row_count(self, sample_model, operation, expected_rows):
+        """Test the row count after creating and changing a model."""
+        operation(sample_model)
+        assert sample_model.rowCount() == expected_rows
     
-    def test_model_data_access(self):
-        """Test accessing model data."""
-        data = [["1", "John", "john@example.com"]]
-        headers = ["ID", "Name", "Email"]
-        
-        model = TableModel(data, headers)
-        
-        index = model.index(0, 1)
-        assert model.data(index) == "John"
+    def test_model_data_access(self, sample_model):
+        """Test accessing model data through Qt model indexes."""
+        assert sample_model.columnCount() == 3
+        index = sample_model.index(0, 1)
+        assert sample_model.data(index) == "John"
     
-    def test_model_append_row(self):
-        """Test appending row to model."""
-        data = [["1", "John", "john@example.com"]]
-        headers = ["ID", "Name", "Email"]
-        
-        model = TableModel(data, headers)
-        assert model.rowCount() == 1
+    def test_model_row_values(self, sample_model):
+        """Test reading stored rows directly."""
+        assert sample_model.rowValues(0) == ["1", "John", "john@example.com"]
+        assert sample_model.rowValues(1) == ()
+    
+    def test_model_header_data(self):
+        """Test horizontal and vertical header labels."""
+        model = TableModel([["1", "John"], ["2", "Jane"]], ["ID", "Name"])
         
-        model.appendRow(["2", "Jane", "jane@example.com"])
-        assert model.rowCount() == 2
+        assert model.headerData(1, Qt.Orientation.Horizontal) == "Name"
+        assert model.headerData(2, Qt.Orientation.Horizontal) is None
+        assert model.headerData(0, Qt.Orientation.Vertical) == "1"
+        assert model.headerData(41, Qt.Orientation.Vertical) == "42"
+        assert model.headerData(4, Qt.Orientation.Vertical) == "5"
+        assert model.headerData(10_000_000, Qt.Orientation.Vertical) == "10000001"
+        assert len(data_table_module._ROW_LABELS) <= data_table_module._ROW_LABEL_CACHE_SIZE
+        assert model.headerData(0, Qt.Orientation.Vertical, Qt.ItemDataRole.ToolTipRole) is None
     
-    def test_model_clear(self):
-        """Test clearing model data."""
-        data = [["1", "John", "john@example.com"]]
-        headers = ["ID", "Name", "Email"]
+    def test_model_append_rows(self):
+        """Test appending several rows in one insertion."""
+        model = TableModel([["1", "John"]], ["ID", "Name"])
+        inserted = []
+        model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
         
-        model = TableModel(data, headers)
-        assert model.rowCount() == 1
+        model.appendRows([["2", "Jane"], ["3", "Bob"]])
+        model.appendRows([])
         
-        model.clear()
-        assert model.rowCount() == 0
+        assert model.rowCount() == 3
+        assert inserted == [(1, 2)]
+        assert model.rowValues(2) == ["3", "Bob"]
 
 
 class TestDataTable:
     """Tests for data table widget."""
     
-    def test_table_creation(self, qapp):
+    def test_table_creation(self, data_table):
         """Test creating a data table."""
-        table = DataTable()
+        assert data_table is not None
+        assert data_table._model is not None
+    
+    def test_table_custom_model(self):
+        """Test creating a data table with a supplied model."""
+        model = TableModel([["1", "John"]], ["ID", "Name"])
+        table = DataTable(model=model)
         
-        assert table is not None
-        assert table._model is not None
+        assert table.model() is model
+        assert table.getRowData(0) == ["1", "John"]
+        assert table.getRowData(1) == ()
+        assert table.getRowData(-1) == ()
     
-    def test_table_set_data(self, qapp):
+    def test_table_set_data(self, data_table):
         """Test setting table data."""
-        table = DataTable()
-        
         data = [["1", "John"], ["2", "Jane"]]
         headers = ["ID", "Name"]
         
-        table.setData(data, headers)
+        data_table.setData(data, headers)
         
-        assert table._model.rowCount() == 2
-        assert table._model.columnCount() == 2
+        assert data_table._model.rowCount() == 2
+        assert data_table._model.columnCount() == 2
     
-    def test_table_append_row(self, qapp):
+    def test_table_append_row(self, data_table):
         """Test appending row to table."""
-        table = DataTable()
-        
         data = [["1", "John"]]
         headers = ["ID", "Name"]
-        table.setData(data, headers)
+        data_table.setData(data, headers)
         
-        table.appendRow(["2", "Jane"])
-        assert table._model.rowCount() == 2
+        data_table.appendRow(["2", "Jane"])
+        assert data_table._model.rowCount() == 2
     
-    def test_table_clear(self, qapp):
+    def test_table_clear(self, data_table):
         """Test clearing table."""
-        table = DataTable()
-        
         data = [["1", "John"]]
         headers = ["ID", "Name"]
-        table.setData(data, headers)
+        data_table.setData(data, headers)
         
-        table.clear()
-        assert table._model.rowCount() == 0
+        data_table.clear()
+        assert data_table._model.rowCount() == 0
+
+
+class TestFilterProxyModel:
+    """Tests for filter proxy model."""
+    
+    def test_filter_rows(self):
+        """Test filtering rows by field and operator."""
+        model = TableModel(
+            [["1", "John", "Active"], ["2", "Jane", "Inactive"], ["3", "Bob", "Active"]],
+            ["ID", "Name", "Status"]
+        )
+        proxy = FilterProxyModel()
+        proxy.setSourceModel(model)
+        
+        proxy.set_filter("Status", "Equals", "active")
+        assert proxy.rowCount() == 2
+        
+        proxy.set_filter("Name", "Starts with", "ja")
+        assert proxy.rowCount() == 1
+        assert proxy.index(0, 1).data() == "Jane"
+        
+        proxy.set_filter("*", "Contains", "o")
+        assert proxy.rowCount() == 2
+        
+        proxy.set_filter("", "", "")
+        assert proxy.rowCount() == 3
+    
+    def test_filter_follows_source_changes(self):
+        """Test an active filter is re-evaluated when the source changes."""
+        model = TableModel([["1", "John"], ["2", "Jane"]], ["ID", "Name"])
+        proxy = FilterProxyModel()
+        proxy.setSourceModel(model)
+        
+        proxy.set_filter("Name", "Starts with", "j")
+        assert proxy.rowCount() == 2
+        
+        model.appendRows([["3", "Jack"], ["4", "Bob"]])
+        assert proxy.rowCount() == 3
+        
+        model.setData([["5", "Joe"], ["6", "Ann"]])
+        assert proxy.rowCount() == 1
+        assert proxy.index(0, 1).data() == "Joe"
+
+
+class TestFilterWidget:
+    """Tests for filter widget."""
+    
+    def test_quick_search_debounced(self):
+        """Test quick search emits once typing pauses."""
+        widget = FilterWidget()
+        emitted = []
+        widget.filterChanged.connect(lambda *args: emitted.append(args))
+        
+        for text in ("j", "jo", "joh"):
+            widget.search_input.setText(text)
+        assert emitted == []
+        assert widget._search_timer.isActive()
+        
+        widget._search_timer.stop()
+        widget._emit_search()
+        assert emitted == [("*", "Contains", "joh")]
+        
+        widget._on_clear_clicked()
+        assert not widget._search_timer.isActive()
+        assert emitted[-1] == ("", "", "")
+
+
+class TestChartWidget:
+    """Tests for chart widget."""
+    
+    def test_chart_rendering_options(self):
+        """Test animations and antialiasing are opt-in."""
+        pytest.importorskip("PyQt6.QtCharts")
+        from PyQt6.QtCharts import QChart
+        from PyQt6.QtGui import QPainter
+        from src.widgets.chart_widget import ChartWidget
+        
+        chart = ChartWidget()
+        antialiasing = QPainter.RenderHint.Antialiasing
+        assert chart.chart.animationOptions() == QChart.AnimationOption(0)
+        assert not chart.chart_view.renderHints() & antialiasing
+        
+        chart.setAnimated(True)
+        chart.setAntialiased(True)
+        assert chart.chart.animationOptions() == QChart.AnimationOption.SeriesAnimations
+        assert chart.chart_view.renderHints() & antialiasing
+    
+    def test_bar_chart_legend(self):
+        """Test the legend is only shown for several series."""
+        pytest.importorskip("PyQt6.QtCharts")
+        from src.widgets.chart_widget import ChartWidget
+        
+        chart = ChartWidget()
+        chart.createBarChart(["A", "B"], [("Count", [1, 2])])
+        assert not chart.chart.legend().isVisible()
+        
+        chart.createBarChart(["A", "B"], [("Done", [1, 2]), ("Failed", [0, 1])])
+        assert chart.chart.legend().isVisible()
+        assert len(chart.chart.series()[0].barSets()) == 2
+    
+    def test_bar_chart_update_in_place(self):
+        """Test updating a bar chart reuses its series and axes."""
+        pytest.importorskip("PyQt6.QtCharts")
+        from src.widgets.chart_widget import ChartWidget
+        
+        chart = ChartWidget()
+        chart.createBarChart(["A", "B"], [("Count", [1, 10])], "Status", "Count")
+        series = chart.chart.series()[0]
+        bar_set = series.barSets()[0]
+        axes = chart.chart.axes()
+        
+        chart.createBarChart(["A", "B"], [("Count", [5, 50])], "Status", "Count")
+        assert chart.chart.series() == [series]
+        assert series.barSets() == [bar_set]
+        assert [bar_set.at(0), bar_set.at(1)] == [5, 50]
+        assert chart.chart.axes() == axes
+        assert chart._axis_y.max() == 50
+        
+        chart.createBarChart(["A", "B", "C"], [("Done", [1, 2, 3]), ("Failed", [0, 1, 0])])
+        assert [s.label() for s in series.barSets()] == ["Done", "Failed"]
+        assert chart._axis_x.categories() == ["A", "B", "C"]
+        assert (chart._axis_y.min(), chart._axis_y.max()) == (0, 3)
+    
+    @pytest.mark.parametrize("categories, data", [
+        ([], []),
+        ([], [("Count", [])]),
+    ])
+    def test_bar_chart_empty_data(self, categories, data):
+        """Test bar charts accept data without values, before and after real data."""
+        pytest.importorskip("PyQt6.QtCharts")
+        from src.widgets.chart_widget import ChartWidget
+        
+        chart = ChartWidget()
+        chart.createBarChart(categories, data)
+        assert (chart._axis_y.min(), chart._axis_y.max()) == (0, 0)
+        
+        chart.createBarChart(["A", "B"], [("Count", [-2, 4])])
+        chart.createBarChart(categories, data)
+        assert len(chart.chart.series()[0].barSets()) == len(data)
+        assert (chart._axis_y.min(), chart._axis_y.max()) == (0, 0)
 
 
 class TestTextArea:
     """Tests for text area widget."""
     
-    def test_text_area_creation(self, qapp):
+    def test_text_area_creation(self, text_area):
         """Test creating a text area."""
-        text_area = TextArea()
-        
         assert text_area is not None
+        assert text_area.font() == TextArea().font()
+        assert text_area.font().pointSize() == 10
     
-    def test_text_area_set_get_text(self, qapp):
+    def test_text_area_set_get_text(self, text_area):
         """Test setting and getting text."""
-        text_area = TextArea()
-        
         text_area.setText("Test text")
         assert text_area.getText() == "Test text"
     
-    def test_text_area_append(self, qapp):
+    def test_text_area_append(self, text_area):
         """Test appending text."""
-        text_area = TextArea()
-        
         text_area.setText("Line 1")
         text_area.appendText("Line 2")
         
-        assert "Line 1" in text_area.getText()
-        assert "Line 2" in text_area.getText()
+        contents = text_area.getText()
+        assert "Line 1" in contents
+        assert "Line 2" in contents
     
-    def test_text_area_clear(self, qapp):
-        """Test clearing text."""
-        text_area = TextArea()
+    def test_text_area_append_lines(self, text_area):
+        """Test appending several lines at once."""
+        text_area.appendLines(["Line 1", "Line 2"])
+        text_area.appendLines(line for line in ["Line 3"])
+        text_area.appendLines([])
         
+        assert text_area.getText() == "Line 1\nLine 2\nLine 3"
+        assert text_area.blockCount() == 3
+    
+    def test_text_area_clear(self, text_area):
+        """Test clearing text."""
         text_area.setText("Test text")
         text_area.clearText()
         
         assert text_area.getText() == ""
     
-    def test_text_area_readonly(self, qapp):
+    def test_text_area_readonly(self, text_area):
         """Test read-only mode."""
-        text_area = TextArea()
-        
         text_area.setReadOnly(True)
         assert text_area.isReadOnly()
         